@@ -8,7 +8,7 @@ import os
 FRAME_WIDTH = config["frame_width"]
 FRAME_HEIGHT = config["frame_height"]
 
-hf = HeaderFooter(
+header_footer = HeaderFooter(
     {
         "Background and Motivation": 4,
         "Proof Logging": 3,
@@ -34,7 +34,7 @@ class AAAITitle(TalkSlide):
 
 class CorrectAnswers(TalkSlide):
     def construct(self):
-        hf.set_current(0, 0)
+        hf = header_footer.at(0, 0)
         self.add(hf)
         text = Text('CP Solvers are "Exact"', **TALK_BODY_TEXT).scale(2)
         self.add(text)
@@ -81,7 +81,7 @@ class CorrectnessMatters(TalkSlide):
             notes="""
             """,
         )
-        hf.set_current(0, 1)
+        hf = header_footer.at(0, 1)
         self.add(hf)
         # self.add(SlideTitle("Correctness Matters!").set_x(0))
 
@@ -104,7 +104,7 @@ class BugsInCPSolvers(TalkSlide):
         - False claim of unsatisfiability
         """,
         )
-        hf.set_current(0, 2)
+        hf = header_footer.at(0, 2)
         self.add(hf)
         bug_imgs = []
         dir = sorted(os.listdir("./img/bugs"))
@@ -135,7 +135,7 @@ class Testing(TalkSlide):
         - Formal verification: far away from being able to deal with CP
         """,
         )
-        hf.set_current(0, 3)
+        hf = header_footer.at(0, 3)
         self.add(hf)
 
         testing_img = Group(ImageMobject("./img/Testing.png"))
@@ -170,7 +170,7 @@ class Testing(TalkSlide):
 
 class ProofLoggingIdea(TalkSlide):
     def construct(self):
-        hf.set_current(1, 0)
+        hf = header_footer.at(1, 0)
         self.add(hf)
         title = SlideTitle("Proof Logging (the basic idea)")
         self.add(title)
@@ -195,7 +195,7 @@ class ProofLoggingIdea(TalkSlide):
 
 class ProofSystemRequirements(TalkSlide):
     def construct(self):
-        hf.set_current(1, 1)
+        hf = header_footer.at(1, 1)
         self.add(hf)
         proof = ProofScroll().move_to([0, 0, 0])
         proof.width = 4.8
@@ -252,7 +252,7 @@ class ProofSystemRequirements(TalkSlide):
 
 class VeriPB(TalkSlide):
     def construct(self):
-        hf.set_current(1, 2)
+        hf = header_footer.at(1, 2)
         self.add(hf)
         veripb = Text(
             "VeriPB",
@@ -307,7 +307,7 @@ class VeriPB(TalkSlide):
 
 class EncodingProblems(TalkSlide):
     def construct(self):
-        hf.set_current(2, 0)
+        hf = header_footer.at(2, 0)
         title = SlideTitle("Pseudo-Boolean Proof Logging for CP")
         self.add(hf)
         self.add(title)
@@ -373,7 +373,7 @@ class EncodingProblems(TalkSlide):
 
 class ProofRules(TalkSlide):
     def construct(self):
-        hf.set_current(2, 2)
+        hf = header_footer.at(2, 2)
         self.add(hf)
         litaxiom = MathTex(r"\quad \frac{\phantom{\Sigma}}{\ell_i \geq 0}", color=BLACK)
 
@@ -435,7 +435,7 @@ class ProofRules(TalkSlide):
 
 class AdditionalRules(TalkSlide):
     def construct(self):
-        hf.set_current(2, 3)
+        hf = header_footer.at(2, 3)
         self.add(hf)
         title = SlideTitle("Additional Rules:")
         self.add(title)
@@ -468,7 +468,7 @@ class AdditionalRules(TalkSlide):
 
 class PrintStatements(TalkSlide):
     def construct(self):
-        hf.set_current(2, 1)
+        hf = header_footer.at(2, 1)
         self.add(hf)
         # Define the initial function code (without print statements)
         code_initial = """
@@ -546,7 +546,7 @@ def run_solver(state):
 
 class ProofLoggingInvariant(TalkSlide):
     def construct(self):
-        hf.set_current(2, 2)
+        hf = header_footer.at(2, 2)
         self.add(hf)
         self.add(SlideTitle("Proof Logging Invariant"))
 
@@ -600,7 +600,7 @@ class ProofLoggingInvariant(TalkSlide):
 
 class BacktrackingSearchProofCP(TalkSlide):
     def construct(self):
-        hf.set_current(3, 2)
+        hf = header_footer.at(3, 2)
         self.add(hf)
         title = SlideTitle("CP Proof Logging Framework")
         self.add(hf)
@@ -736,15 +736,13 @@ class BacktrackingSearchProofCP(TalkSlide):
 
 class TheChallenge(TalkSlide):
     def construct(self):
-        hf.set_current(2, 3)
+        hf = header_footer.at(2, 3)
 
-        big_list = (
-            Group(
-                *[MathTex(b, color=BLACK) for b in big_constraints_list],
-                z_index=hf.z_index - 1,
-            )
-            .arrange(DOWN)
-            .align_to([0, 0, 0], UP)
+        # The list never changes while it scrolls: draw it once, a few rows
+        # at a time, and let each frame show a slice of the bitmap
+        big_list = RasterScroll(
+            VirtualScrollList(big_constraints_list, color=BLACK),
+            z_index=hf.z_index - 1,
         )
 
         self.bring_to_back(big_list)
@@ -753,7 +751,7 @@ class TheChallenge(TalkSlide):
         self.add(big_list)
         self.add(hf)
         self.play(
-            big_list.animate.shift(-big_list.get_bottom()),
+            big_list.scroll_to_end(bottom=0),
             rate_func=rate_functions.linear,
             run_time=25,
         )
@@ -761,7 +759,7 @@ class TheChallenge(TalkSlide):
 
 class ThisPaper(TalkSlide):
     def construct(self):
-        hf.set_current(3, 0)
+        hf = header_footer.at(3, 0)
         self.add(SlideTitle("This Paper:"))
         paper = ImageMobject("./img/paper.png").scale(0.7).shift(DOWN * 0.8 + LEFT * 3)
         paper.set_z_index(-1)
@@ -791,7 +789,7 @@ class ThisPaper(TalkSlide):
 
         pb_enc = (
             MathTex(
-                r"\sum_i 2 i z_{bi} - \sum_i \sum_j 2^{i+j} {{xy_{bij}}} = 0",
+                r"\sum_i 2^i z_{bi} - \sum_i \sum_j 2^{i+j} {{xy_{bij}}} = 0",
                 color=BLACK,
             )
             .next_to(mult_grp, DOWN, buff=1)
@@ -816,7 +814,7 @@ class ThisPaper(TalkSlide):
 
 class BoundsConsistency(TalkSlide):
     def construct(self):
-        hf.set_current(3, 1)
+        hf = header_footer.at(3, 1)
         self.add(hf)
         self.add(SlideTitle("Bounds Consistency"))
         self.add(hf)
@@ -878,7 +876,7 @@ class BoundsConsistency(TalkSlide):
 
 class Overheads(TalkSlide):
     def construct(self):
-        hf.set_current(3, 2)
+        hf = header_footer.at(3, 2)
         self.add(hf)
 
         self.add(SlideTitle("Overheads"))
@@ -892,7 +890,7 @@ class Overheads(TalkSlide):
 
 class Takeaways(TalkSlide):
     def construct(self):
-        hf.set_current(3, 3)
+        hf = header_footer.at(3, 3)
         self.add(hf)
         title = SlideTitle("If nothing else:")
         self.add(title)
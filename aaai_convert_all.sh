@@ -1,5 +1,5 @@
 #!/bin/bash 
-manim-slides convert AAAITitle \
+python -m manim_beamer.build aaai.py AAAITitle \
     CorrectAnswers \
     CorrectnessMatters \
     BugsInCPSolvers \
@@ -14,4 +14,4 @@ manim-slides convert AAAITitle \
     ThisPaper \
     BoundsConsistency \
     Overheads \
-    Takeaways mcilree_aaai2025.html
+    Takeaways -o mcilree_aaai2025.html "$@"
@@ -0,0 +1,223 @@
+# Construction time, memory and per-frame render time of the manim_beamer
+# components at a few sizes, checked against a stored baseline.
+#
+#   python benchmarks/components.py                  # compare with baseline
+#   python benchmarks/components.py --save           # record a new baseline
+#   python benchmarks/components.py -k Scroll -k Table --threshold 0.1
+#
+# Baselines are machine specific: record one per machine before comparing.
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)  # components load images relative to the talk
+
+from manim import *
+from manim.constants import QUALITIES
+
+from bounds_bar import BoundsBar
+from manim_beamer import *
+
+BASELINE = Path(__file__).resolve().parent / "baselines" / "components.json"
+METRICS = ("construct_s", "peak_kib", "frame_s")
+
+
+def _table(rows, cols):
+    return SmartTable(
+        [[str(r * cols + c) for c in range(cols)] for r in range(rows)],
+        col_labels=[f"x_{{{c}}}" for c in range(cols)],
+    )
+
+
+def _ring_graph(n):
+    return CircuitGraph(
+        list(range(n)),
+        [(i, (i + 1) % n) for i in range(n)] + [(i, (i + 2) % n) for i in range(0, n, 3)],
+    )
+
+
+def _bounds_bars(n):
+    return VGroup(
+        *[
+            BoundsBar(
+                var_name=f"X_{{{i}}}",
+                bounds=[(-4, 4), (-3, 2 - i % 3), (-2 + i % 2, 1 - i % 3)],
+            )
+            for i in range(n)
+        ]
+    ).arrange(DOWN)
+
+
+def _constraints(n):
+    return [big_constraints_list[i % len(big_constraints_list)] for i in range(n)]
+
+
+CASES = [
+    ("Tube", "width=2", lambda: Tube(width=2)),
+    ("Tube", "width=8", lambda: Tube(width=8)),
+    ("Scroll", "height=3", lambda: Scroll(height=3)),
+    ("Scroll", "height=12", lambda: Scroll(height=12)),
+    ("ScrollWithTex", "lines=5", lambda: ScrollWithTex(_constraints(5))),
+    ("ScrollWithTex", "lines=40", lambda: ScrollWithTex(_constraints(40))),
+    ("ScrollWithTex", "lines=200", lambda: ScrollWithTex(_constraints(200))),
+    ("ProofDiagram", "default", ProofDiagram),
+    ("CircuitGraph", "example", CircuitGraph.get_example_graph),
+    ("CircuitGraph", "vertices=40", lambda: _ring_graph(40)),
+    ("CircuitGraph", "vertices=160", lambda: _ring_graph(160)),
+    ("HeaderFooter", "sections=4x4", lambda: HeaderFooter({s: 4 for s in "ABCD"})),
+    (
+        "HeaderFooter",
+        "sections=12x12",
+        lambda: HeaderFooter({f"S{i}": 12 for i in range(12)}),
+    ),
+    ("SmartTable", "3x3", lambda: _table(3, 3)),
+    ("SmartTable", "12x6", lambda: _table(12, 6)),
+    ("SmartTable", "40x8", lambda: _table(40, 8)),
+    (
+        "BulletPoints",
+        "items=3",
+        lambda: BulletPoints(*[f"Point {i}" for i in range(3)], **TALK_BODY_TEXT),
+    ),
+    (
+        "BulletPoints",
+        "items=30",
+        lambda: BulletPoints(*[f"Point {i}" for i in range(30)], **TALK_BODY_TEXT),
+    ),
+    ("BoundsBar", "bars=1", lambda: _bounds_bars(1)),
+    ("BoundsBar", "bars=10", lambda: _bounds_bars(10)),
+]
+
+
+def _best(function, repeat):
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def measure(build, repeat):
+    # The first construction fills the TeX and text caches; what's measured
+    # is the steady state every scene after the first one sees
+    mobject = build()
+
+    construct = _best(build, repeat)
+
+    gc.collect()
+    tracemalloc.start()
+    build()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    if isinstance(mobject, Mobject):
+        mobject.scale_to_fit_height(min(mobject.height, config.frame_height))
+
+    def frame():
+        camera = Camera()
+        camera.capture_mobject(mobject)
+
+    return {
+        "construct_s": construct,
+        "peak_kib": peak / 1024,
+        "frame_s": _best(frame, repeat),
+    }
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+    for key, result in results.items():
+        if key not in baseline:
+            print(f"{key:36} (no baseline)")
+            continue
+        changes = []
+        for metric in METRICS:
+            old, new = baseline[key][metric], result[metric]
+            ratio = new / old if old else 1
+            changes.append(f"{metric} {ratio - 1:+7.1%}")
+            if ratio > 1 + threshold:
+                regressions.append((key, metric, old, new))
+        print(f"{key:36} " + "  ".join(changes))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark manim_beamer components against a baseline."
+    )
+    parser.add_argument(
+        "-k",
+        dest="only",
+        action="append",
+        help="only run cases whose name contains this (repeatable)",
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument(
+        "-q",
+        "--quality",
+        default="low_quality",
+        choices=list(QUALITIES),
+        help="camera resolution for the per-frame timings",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="relative slowdown (or memory growth) that counts as a regression",
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument(
+        "--save", action="store_true", help="store these results as the baseline"
+    )
+    args = parser.parse_args(argv)
+
+    quality = QUALITIES[args.quality]
+    results = {}
+    with tempconfig(
+        {
+            "pixel_width": quality["pixel_width"],
+            "pixel_height": quality["pixel_height"],
+            "verbosity": "WARNING",
+        }
+    ):
+        for name, size, build in CASES:
+            if args.only and not any(k in name for k in args.only):
+                continue
+            key = f"{name}[{size}]"
+            results[key] = measure(build, args.repeat)
+            r = results[key]
+            print(
+                f"{key:36} construct {r['construct_s'] * 1e3:9.2f} ms  "
+                f"peak {r['peak_kib']:9.0f} KiB  frame {r['frame_s'] * 1e3:8.2f} ms"
+            )
+
+    if args.save:
+        baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+        baseline.update(results)
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True))
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --save to record one")
+        return 0
+
+    print()
+    regressions = compare(results, json.loads(args.baseline.read_text()), args.threshold)
+    for key, metric, old, new in regressions:
+        print(f"REGRESSION {key} {metric}: {old:.4g} -> {new:.4g}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
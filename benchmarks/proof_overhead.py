@@ -0,0 +1,313 @@
+# The cost of proof logging in the reference solver, as on the Overheads
+# slide: every instance is solved with logging off, on, and on followed by a
+# proof check, in parallel worker processes with a per-instance timeout.
+# Results go to CSV, and the slide's plots are drawn from that CSV.
+#
+#   python benchmarks/proof_overhead.py run -j 4 --timeout 120
+#   python benchmarks/proof_overhead.py plot --out img
+#
+# Checking runs the --checker command (VeriPB by default) on an OPB encoding
+# of the model and the proof; if it isn't installed, check_status says so.
+
+import argparse
+import csv
+import multiprocessing
+import queue
+import shlex
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from proof_logger import ProofLogger
+from reference_solver import queens, run
+
+RESULTS = Path(__file__).resolve().parent / "results" / "proof_overhead.csv"
+MODES = ("off", "on", "checked")
+FIELDS = (
+    "instance",
+    "mode",
+    "status",
+    "wall_s",
+    "nodes",
+    "solutions",
+    "proof_bytes",
+    "check_s",
+    "check_status",
+)
+
+
+def _literal(id, value):
+    return f"x{id}_{value}"
+
+
+def write_opb(model, ids, path):
+    # The model in the proof's naming (x<id>_<value> for var = value): exactly
+    # one value per variable and, for x != y + offset, never both x = v and
+    # y = v - offset
+    ids = dict(ids)
+    for var in range(len(model.domains)):
+        ids.setdefault(var, len(ids) + 1)
+
+    def values(var):
+        mask = model.domains[var]
+        return [v for v in range(mask.bit_length()) if mask >> v & 1]
+
+    lines = []
+    for var in range(len(model.domains)):
+        literals = [_literal(ids[var], v) for v in values(var)]
+        lines.append("".join(f"+1 {l} " for l in literals) + ">= 1 ;\n")
+        lines.append("".join(f"-1 {l} " for l in literals) + ">= -1 ;\n")
+    for c in model.constraints:
+        y_values = set(values(c.y))
+        for v in values(c.x):
+            if v - c.offset in y_values:
+                x, y = _literal(ids[c.x], v), _literal(ids[c.y], v - c.offset)
+                lines.append(f"+1 ~{x} +1 ~{y} >= 1 ;\n")
+
+    num_literals = sum(len(values(var)) for var in range(len(model.domains)))
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"* #variable= {num_literals} #constraint= {len(lines)}\n")
+        f.writelines(lines)
+
+
+def _check(command, model_path, proof_path, timeout):
+    argv = [a.format(model=model_path, proof=proof_path) for a in shlex.split(command)]
+    if shutil.which(argv[0]) is None:
+        return "", "unavailable"
+    start = time.perf_counter()
+    try:
+        result = subprocess.run(argv, capture_output=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return "", "timeout"
+    check_s = time.perf_counter() - start
+    return check_s, "ok" if result.returncode == 0 else f"failed ({result.returncode})"
+
+
+def run_task(task):
+    # One instance in one mode; runs inside a worker process
+    model = queens(task["queens"])
+    row = dict.fromkeys(FIELDS, "")
+    row.update(instance=task["instance"], mode=task["mode"])
+
+    with tempfile.TemporaryDirectory(dir=task["work_dir"]) as work:
+        proof_path = Path(work) / "search.pbp"
+        proof = None if task["mode"] == "off" else ProofLogger(proof_path)
+        start = time.perf_counter()
+        stats = run(model, proof=proof)
+        if proof:
+            # Waiting for the writer to finish is part of the cost
+            proof.close()
+        row.update(
+            status="ok",
+            wall_s=time.perf_counter() - start,
+            nodes=stats.nodes,
+            solutions=stats.solutions,
+        )
+        if proof:
+            row["proof_bytes"] = proof_path.stat().st_size
+        if task["mode"] == "checked":
+            model_path = Path(work) / "model.opb"
+            write_opb(model, proof.ids, model_path)
+            row["check_s"], row["check_status"] = _check(
+                task["checker"], model_path, proof_path, task["timeout"]
+            )
+    return row
+
+
+def _worker(task, results):
+    try:
+        row = run_task(task)
+    except Exception as e:
+        row = dict.fromkeys(FIELDS, "")
+        row.update(instance=task["instance"], mode=task["mode"], status=f"error: {e}")
+    results.put((task["key"], row))
+
+
+def run_all(tasks, jobs, timeout):
+    # A process per task, at most jobs at once; one that runs past the timeout
+    # is killed and recorded as such
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    pending = list(tasks)
+    running = {}
+    rows = {}
+
+    def finish(key, row):
+        # A worker can report just before it's killed for the timeout; the
+        # first outcome recorded stands
+        if key not in running:
+            return
+        process = running.pop(key)[0]
+        process.join()
+        rows[key] = row
+        print(f"{row['instance']:>12} {row['mode']:>8} {row['status']:>8} {row['wall_s']}")
+
+    while pending or running:
+        while pending and len(running) < jobs:
+            task = pending.pop(0)
+            process = context.Process(target=_worker, args=(task, results), daemon=True)
+            process.start()
+            running[task["key"]] = (process, time.monotonic(), task)
+
+        try:
+            finish(*results.get(timeout=0.1))
+        except queue.Empty:
+            pass
+
+        for key, (process, started, task) in list(running.items()):
+            if process.exitcode == 0:
+                continue  # finished; its row is on the queue
+            failed = not process.is_alive() and process.exitcode not in (0, None)
+            if time.monotonic() - started > timeout or failed:
+                process.terminate()
+                row = dict.fromkeys(FIELDS, "")
+                row.update(
+                    instance=task["instance"],
+                    mode=task["mode"],
+                    status="crashed" if failed else "timeout",
+                    wall_s="" if failed else timeout,
+                )
+                finish(key, row)
+    return [rows[task["key"]] for task in tasks]
+
+
+def write_csv(rows, path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def read_csv(path):
+    with open(path, newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def _times(rows, mode, field="wall_s", status="status"):
+    return {
+        r["instance"]: float(r[field])
+        for r in rows
+        if r["mode"] == mode and r[status] == "ok" and r[field]
+    }
+
+
+def plot(rows, out):
+    try:
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("Plotting needs matplotlib (pip install matplotlib)", file=sys.stderr)
+        return 1
+    out.mkdir(parents=True, exist_ok=True)
+
+    # experiments1: solving time with proof logging against without
+    off, on = _times(rows, "off"), _times(rows, "on")
+    common = sorted(set(off) & set(on))
+    fig, ax = plt.subplots(figsize=(6, 4))
+    ax.scatter([off[i] for i in common], [on[i] for i in common], s=12)
+    if common:
+        limits = [min(off[i] for i in common), max(on[i] for i in common)]
+        ax.plot(limits, limits, "k--", linewidth=0.8)
+    ax.set(
+        xscale="log",
+        yscale="log",
+        xlabel="Runtime without proof logging (s)",
+        ylabel="Runtime with proof logging (s)",
+    )
+    fig.tight_layout()
+    fig.savefig(out / "experiments1.png", dpi=500)
+    plt.close(fig)
+
+    # experiments2: checking time against solving time with proof logging
+    checked, check = _times(rows, "checked"), _times(rows, "checked", "check_s", "check_status")
+    common = sorted(set(checked) & set(check))
+    fig, ax = plt.subplots(figsize=(6, 4))
+    ax.scatter([checked[i] for i in common], [check[i] for i in common], s=12)
+    ax.set(
+        xscale="log",
+        yscale="log",
+        xlabel="Runtime with proof logging (s)",
+        ylabel="Proof checking time (s)",
+    )
+    fig.tight_layout()
+    fig.savefig(out / "experiments2.png", dpi=500)
+    plt.close(fig)
+    if not common:
+        print("No checked runs with timings; experiments2.png is empty", file=sys.stderr)
+    print(f"Wrote {out / 'experiments1.png'} and {out / 'experiments2.png'}")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Measure proof-logging overhead of the reference solver."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="solve the instances and write CSV")
+    run_parser.add_argument(
+        "--queens",
+        type=int,
+        nargs="+",
+        default=[6, 7, 8, 9, 10],
+        help="n-queens board sizes to solve (all solutions)",
+    )
+    run_parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    run_parser.add_argument(
+        "-j", "--jobs", type=int, default=multiprocessing.cpu_count()
+    )
+    run_parser.add_argument(
+        "--timeout", type=float, default=300, help="seconds per instance and mode"
+    )
+    run_parser.add_argument(
+        "--checker",
+        default="veripb {model} {proof}",
+        help="checker command, with {model} and {proof} placeholders",
+    )
+    run_parser.add_argument("--work-dir", type=Path, default=None)
+    run_parser.add_argument("-o", "--output", type=Path, default=RESULTS)
+    run_parser.add_argument(
+        "--plot", type=Path, metavar="DIR", help="also draw the plots into DIR"
+    )
+
+    plot_parser = commands.add_parser("plot", help="draw the plots from a results CSV")
+    plot_parser.add_argument("csv", type=Path, nargs="?", default=RESULTS)
+    plot_parser.add_argument("--out", type=Path, default=RESULTS.parent)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "plot":
+        return plot(read_csv(args.csv), args.out)
+
+    tasks = [
+        {
+            "key": (f"queens-{n}", mode),
+            "instance": f"queens-{n}",
+            "queens": n,
+            "mode": mode,
+            "checker": args.checker,
+            "timeout": args.timeout,
+            "work_dir": args.work_dir,
+        }
+        for n in args.queens
+        for mode in args.modes
+    ]
+    rows = run_all(tasks, args.jobs, args.timeout)
+    write_csv(rows, args.output)
+    print(f"Wrote {len(rows)} results to {args.output}")
+    if args.plot:
+        return plot(rows, args.plot)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+# Search nodes per second of the reference solver, trail-and-undo against
+# cloning the state per branch, on models that grow by adding independent
+# 8-queens boards.
+#
+#   python benchmarks/solver_throughput.py
+#   python benchmarks/solver_throughput.py --copies 1 100 1000 --nodes 50000
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from reference_solver import queens, run, run_cloning_solver, run_solver
+
+SOLVERS = {"trail": run_solver, "clone": run_cloning_solver}
+
+
+def measure(model, solver, nodes, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        stats = run(model, solver, node_limit=nodes)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best[0]:
+            best = (elapsed, stats)
+    elapsed, stats = best
+    return stats.nodes / elapsed, stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compare trail-based and cloning search throughput."
+    )
+    parser.add_argument("-n", "--queens", type=int, default=8, help="board size")
+    parser.add_argument(
+        "--copies",
+        type=int,
+        nargs="+",
+        default=[1, 100, 1000, 5000],
+        help="numbers of independent boards in the model",
+    )
+    parser.add_argument("--nodes", type=int, default=20000, help="node limit per run")
+    parser.add_argument("-r", "--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    # Each board adds n levels to the search depth
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 4 * args.queens * max(args.copies)))
+
+    print(f"{'variables':>10} {'trail nodes/s':>14} {'clone nodes/s':>14} {'speedup':>8}")
+    for copies in args.copies:
+        model = queens(args.queens, copies)
+        rates = {}
+        for name, solver in SOLVERS.items():
+            rates[name], stats = measure(model, solver, args.nodes, args.repeat)
+        print(
+            f"{len(model.domains):>10} {rates['trail']:>14.0f} {rates['clone']:>14.0f} "
+            f"{rates['trail'] / rates['clone']:>7.2f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,7 @@
 from manim import *
 from manim_beamer.constants import *
+from manim_beamer.glyph_pool import INTEGER_GLYPHS, GlyphPool
+from manim_beamer.tex_batch import batch_mathtex
 
 FRAME_WIDTH = config["frame_width"]
 FRAME_HEIGHT = config["frame_height"]
@@ -113,3 +115,219 @@ class BoundsBar(VGroup):
             )
 
             self.var_label.move_to(mid)
+
+
+class TrackedBoundsBar(VGroup):
+    # A BoundsBar whose bounds live in ValueTrackers. An updater keeps the
+    # rectangles and labels in step with them, so bounds can be animated
+    # continuously (see BoundsSweep) and labels are assembled from a glyph
+    # pool instead of being typeset for every new value.
+
+    def __init__(
+        self,
+        var_name="X",
+        max_bounds=(-5, 4),
+        bounds=[(-4, 4), (-3, 2), (-2, 1)],
+        **kwargs
+    ):
+        width = FRAME_WIDTH / 5 * 4
+        height = width / 16
+        super().__init__()
+
+        self.outer_rect = Rectangle(width=width, height=height, stroke_color=BLACK)
+
+        self.colors = [GRAY, RED, UG_COBALT]
+        self.max_bounds = max_bounds
+        self.max_range = max_bounds[1] - max_bounds[0]
+        self.unit = width / self.max_range
+        self.trackers = [(ValueTracker(lo), ValueTracker(hi)) for lo, hi in bounds]
+        self.pool = GlyphPool(INTEGER_GLYPHS + (r"\leq",), color=BLACK)
+
+        self.fill_rect = {}
+        self.labels = {}
+        self._shown = {}
+        for color in self.colors:
+            self.fill_rect[color] = Rectangle(
+                width=width,
+                height=height,
+                fill_color=color,
+                fill_opacity=1,
+                stroke_width=0,
+            )
+            self.labels[color] = [VGroup(), VGroup()]
+            self.add(self.fill_rect[color], *self.labels[color])
+
+        self.var_label = MathTex(var_name, color=BLACK)
+        self.add(self.outer_rect, self.var_label)
+
+        self._sync()
+        self.add_updater(lambda m: m._sync())
+
+    def get_bounds(self):
+        return np.array(
+            [[lo.get_value(), hi.get_value()] for lo, hi in self.trackers]
+        )
+
+    def set_bounds(self, bounds):
+        for (lo, hi), (new_lo, new_hi) in zip(self.trackers, bounds):
+            lo.set_value(new_lo)
+            hi.set_value(new_hi)
+        return self._sync()
+
+    def update_bounds(self, bounds):
+        return self.set_bounds(bounds)
+
+    def _set_label(self, color, side, value, visible):
+        # Only rebuilt when the shown integer (or its visibility) changes
+        label = self.labels[color][side]
+        key = (value, visible)
+        if self._shown.get((color, side)) != key:
+            glyphs = [*str(value), r"\leq"] if side == 0 else [r"\leq", *str(value)]
+            new = (
+                self.pool.text(glyphs)
+                .scale(0.9)
+                .set_color(BLACK if color == self.colors[-1] else GRAY)
+                .set_opacity(float(visible))
+            )
+            label.submobjects = new.submobjects
+            self._shown[(color, side)] = key
+
+        corner = UP + LEFT if side == 0 else UP + RIGHT
+        label.move_to(self.fill_rect[color].get_corner(corner) + UP * 0.3)
+
+    def _sync(self):
+        bounds = self.get_bounds()
+        shown = np.rint(bounds).astype(int)
+        left = self.outer_rect.get_left()
+
+        for i, color in enumerate(self.colors):
+            lo, hi = bounds[i]
+            self.fill_rect[color].stretch_to_fit_width(
+                max((hi - lo) * self.unit, 1e-3)
+            ).move_to(left + RIGHT * ((lo + hi) / 2 - self.max_bounds[0]) * self.unit)
+
+            # Outer levels' labels only show where they differ from the next
+            # level in, which would otherwise be drawn on top of them
+            last = i == len(self.colors) - 1
+            for side in (0, 1):
+                visible = last or shown[i][side] != shown[i + 1][side]
+                self._set_label(color, side, shown[i][side], visible)
+
+        inner = self.labels[self.colors[-1]]
+        self.var_label.move_to((inner[0].get_center() + inner[1].get_center()) / 2)
+        return self
+
+
+class BoundsPanel(VGroup):
+    # Bounds of many variables at once. All bounds live in one array of shape
+    # (variables, levels, 2), and each level's rectangles, for every
+    # variable, are the subpaths of a single VMobject, so an update is a
+    # handful of array operations however many variables there are.
+
+    def __init__(
+        self,
+        var_names,
+        max_bounds=(-5, 4),
+        bounds=None,
+        colors=(GRAY, RED, UG_COBALT),
+        width=FRAME_WIDTH / 5 * 4,
+        row_height=0.25,
+        buff=0.1,
+        **kwargs
+    ):
+        super().__init__()
+        self.colors = list(colors)
+        self.max_bounds = max_bounds
+        self.unit = width / (max_bounds[1] - max_bounds[0])
+        self.row_height = row_height
+        self.pitch = row_height + buff
+
+        if bounds is None:
+            bounds = np.broadcast_to(
+                np.array(max_bounds, dtype=float),
+                (len(var_names), len(self.colors), 2),
+            )
+        self.bounds = np.array(bounds, dtype=float)
+
+        # Rows hang below this point; moving the panel moves it
+        self.anchor = VectorizedPoint(ORIGIN)
+        self.levels = [
+            VMobject(fill_color=color, fill_opacity=1, stroke_width=0)
+            for color in self.colors
+        ]
+        self.outline = VMobject(stroke_color=BLACK, stroke_width=2)
+        self.outline.set_points(
+            self._rectangles(
+                np.broadcast_to(np.array(max_bounds, dtype=float), (len(var_names), 2))
+            )
+        )
+
+        self.var_labels = VGroup(*batch_mathtex(var_names, color=BLACK))
+        for i, label in enumerate(self.var_labels):
+            label.scale_to_fit_height(min(label.height, row_height * 0.8))
+            label.next_to(self._row_left(i), LEFT, buff=0.2)
+
+        self.add(self.anchor, *self.levels, self.outline, self.var_labels)
+        self.set_bounds(self.bounds)
+        self.center()
+
+    def _row_left(self, i):
+        return self.anchor.get_center() + DOWN * (i * self.pitch + self.row_height / 2)
+
+    def _rectangles(self, bounds):
+        # (variables, 2) bounds -> the points of one closed, straight-edged
+        # cubic subpath per variable
+        origin = self.anchor.get_center()
+        rows = np.arange(len(bounds))
+        x0 = origin[0] + (bounds[:, 0] - self.max_bounds[0]) * self.unit
+        upper = np.maximum(bounds[:, 1], bounds[:, 0])
+        x1 = origin[0] + (upper - self.max_bounds[0]) * self.unit
+        top = origin[1] - rows * self.pitch
+        bottom = top - self.row_height
+
+        corners = np.zeros((len(bounds), 5, 3))
+        corners[:, :, 0] = np.stack([x0, x1, x1, x0, x0], axis=1)
+        corners[:, :, 1] = np.stack([top, top, bottom, bottom, top], axis=1)
+
+        start, end = corners[:, :-1, None], corners[:, 1:, None]
+        thirds = np.array([0, 1 / 3, 2 / 3, 1])[None, None, :, None]
+        return (start + (end - start) * thirds).reshape(-1, 3)
+
+    def get_bounds(self):
+        return self.bounds.copy()
+
+    def set_bounds(self, bounds):
+        self.bounds = np.array(bounds, dtype=float)
+        for level, mobject in enumerate(self.levels):
+            mobject.set_points(self._rectangles(self.bounds[:, level]))
+        return self
+
+    def update_bounds(self, bounds):
+        return self.set_bounds(bounds)
+
+    def tighten(self, var, level, lower=None, upper=None):
+        bounds = self.get_bounds()
+        if lower is not None:
+            bounds[var, level, 0] = lower
+        if upper is not None:
+            bounds[var, level, 1] = upper
+        return self.set_bounds(bounds)
+
+
+class BoundsSweep(Animation):
+    # Takes a TrackedBoundsBar or BoundsPanel through a whole sequence of
+    # bound states (each what get_bounds returns) as one animation, with
+    # every step getting an equal share of the run time
+    def __init__(self, bar, states, run_time=None, rate_func=linear, **kwargs):
+        self.states = np.array(
+            [bar.get_bounds(), *[np.array(s, dtype=float) for s in states]]
+        )
+        if run_time is None:
+            run_time = max(0.5 * len(states), 1)
+        super().__init__(bar, run_time=run_time, rate_func=rate_func, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        position = self.rate_func(alpha) * (len(self.states) - 1)
+        k = min(max(int(position), 0), len(self.states) - 2)
+        t = position - k
+        self.mobject.set_bounds((1 - t) * self.states[k] + t * self.states[k + 1])
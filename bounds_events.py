@@ -0,0 +1,63 @@
+# Bound-change traces: a solver writes one event per line,
+#
+#     <var> <level> <lo> <hi> [reason ...]
+#
+# e.g. "X 2 2 3 X*Y=Z". Lines starting with # are comments. Files ending in
+# .gz are read compressed. Nothing here needs manim, so solvers and
+# bounds_propagation can read and write traces without it; TracePlayer in
+# bounds_trace replays them onto BoundsBars.
+
+import gzip
+from collections import namedtuple
+
+BoundsEvent = namedtuple("BoundsEvent", ["var", "level", "lo", "hi", "reason"])
+
+
+def parse_event(line):
+    fields = line.split(maxsplit=4)
+    if len(fields) < 4:
+        raise ValueError(f"expected 'var level lo hi [reason]', got {line!r}")
+    var, level, lo, hi = fields[:4]
+    reason = fields[4].rstrip("\n") if len(fields) > 4 else ""
+    return BoundsEvent(var, int(level), int(lo), int(hi), reason)
+
+
+def format_event(var, level, lo, hi, reason=""):
+    return f"{var} {level} {lo} {hi} {reason}".rstrip() + "\n"
+
+
+def _open(path, mode):
+    path = str(path)
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def read_trace(path):
+    # One event at a time, however long the trace is
+    with _open(path, "r") as f:
+        for number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                yield parse_event(line)
+            except ValueError as e:
+                raise ValueError(f"{path}:{number}: {e}") from None
+
+
+class TraceWriter:
+    def __init__(self, path):
+        self.file = _open(path, "w")
+
+    def write(self, var, level, lo, hi, reason=""):
+        self.file.write(format_event(var, level, lo, hi, reason))
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,147 @@
+# Bounds consistency for X * Y = Z, over NumPy arrays of (lo, hi) bounds so
+# thousands of independent constraints propagate in one call:
+#
+#     x, y, z, ok = propagate_multiplication([[-6, 5]], [[-1, 2]], [[-4, -1]])
+#     # x == [[-4, 4]]
+#
+# This is bounds(R) consistency: a bound with no real-valued support is
+# removed, but divisibility isn't checked, so a bound supported only by a
+# fractional value of another variable can stay.
+#
+# Bounds are int64 while every value fits in 31 bits (so products can't
+# overflow) and exact Python ints in object arrays beyond that.
+
+from collections import namedtuple
+
+import numpy as np
+
+from bounds_events import BoundsEvent
+
+SAFE_BOUND = 2**31
+
+Propagation = namedtuple("Propagation", ["x", "y", "z", "consistent"])
+
+
+def _bounds_arrays(*bounds):
+    arrays = [np.array(b, dtype=object).reshape(-1, 2) for b in bounds]
+    exact = any(np.abs(a).max(initial=0) >= SAFE_BOUND for a in arrays)
+    return [a if exact else a.astype(np.int64) for a in arrays]
+
+
+def _min(*values):
+    result = values[0]
+    for v in values[1:]:
+        result = np.minimum(result, v)
+    return result
+
+
+def _max(*values):
+    result = values[0]
+    for v in values[1:]:
+        result = np.maximum(result, v)
+    return result
+
+
+def _floor_div(a, b):
+    return a // b
+
+
+def _ceil_div(a, b):
+    return -(-a // b)
+
+
+def product_bounds(x, y):
+    corners = [x[:, i] * y[:, j] for i in (0, 1) for j in (0, 1)]
+    return np.stack([_min(*corners), _max(*corners)], axis=1)
+
+
+def _quotient_part(z, lo, hi, valid):
+    # Integer bounds of z / y for y in [lo, hi], a range without 0; z / y is
+    # monotone in both arguments there, so the corners give the extremes
+    lo = np.where(valid, lo, 1)
+    hi = np.where(valid, hi, 1)
+    ceils = [_ceil_div(z[:, i], d) for i in (0, 1) for d in (lo, hi)]
+    floors = [_floor_div(z[:, i], d) for i in (0, 1) for d in (lo, hi)]
+    return _min(*ceils), _max(*floors)
+
+
+def quotient_bounds(z, y, x):
+    # New bounds for x from x = z / y. When y's range holds 0 it is split
+    # into its negative and positive parts (y = 0 can't give a non-zero z),
+    # each part is cut to x's bounds before they are joined, so a part with
+    # no support doesn't widen the result, and only if z can be 0 as well is
+    # x left alone.
+    xlo, xhi = x[:, 0], x[:, 1]
+    ylo, yhi = y[:, 0], y[:, 1]
+    neg_lo, neg_hi = _quotient_part(z, ylo, np.minimum(yhi, -1), ylo <= -1)
+    pos_lo, pos_hi = _quotient_part(z, np.maximum(ylo, 1), yhi, yhi >= 1)
+    neg_lo, neg_hi = _max(neg_lo, xlo), _min(neg_hi, xhi)
+    pos_lo, pos_hi = _max(pos_lo, xlo), _min(pos_hi, xhi)
+    negative = (ylo <= -1) & (neg_lo <= neg_hi)
+    positive = (yhi >= 1) & (pos_lo <= pos_hi)
+
+    lo = np.where(negative & positive, _min(neg_lo, pos_lo), np.where(negative, neg_lo, pos_lo))
+    hi = np.where(negative & positive, _max(neg_hi, pos_hi), np.where(negative, neg_hi, pos_hi))
+    # Neither part has support: x is empty
+    lo = np.where(negative | positive, lo, xhi + 1)
+    hi = np.where(negative | positive, hi, xhi)
+
+    z_has_zero = (z[:, 0] <= 0) & (z[:, 1] >= 0)
+    prune = ~((ylo <= 0) & (yhi >= 0) & z_has_zero)
+    return np.stack([np.where(prune, lo, xlo), np.where(prune, hi, xhi)], axis=1)
+
+
+def _intersect(a, b):
+    return np.stack([_max(a[:, 0], b[:, 0]), _min(a[:, 1], b[:, 1])], axis=1)
+
+
+def propagate_step(x, y, z):
+    # One round of Z, then X, then Y, each using the others' latest bounds
+    z = _intersect(z, product_bounds(x, y))
+    x = _intersect(x, quotient_bounds(z, y, x))
+    y = _intersect(y, quotient_bounds(z, x, y))
+    return x, y, z
+
+
+def propagate_multiplication(x, y, z, max_rounds=None):
+    # Runs every constraint to its fixpoint. Constraints drop out of the
+    # batch as soon as they stop changing or a domain empties.
+    x, y, z = _bounds_arrays(x, y, z)
+    consistent = np.ones(len(x), dtype=bool)
+    active = np.arange(len(x))
+
+    rounds = 0
+    while len(active) and (max_rounds is None or rounds < max_rounds):
+        rounds += 1
+        old = (x[active], y[active], z[active])
+        new = propagate_step(*old)
+        x[active], y[active], z[active] = new
+
+        failed = np.zeros(len(active), dtype=bool)
+        changed = np.zeros(len(active), dtype=bool)
+        for before, after in zip(old, new):
+            failed |= after[:, 0] > after[:, 1]
+            changed |= (before != after).any(axis=1)
+
+        consistent[active[failed]] = False
+        active = active[changed & ~failed]
+
+    return Propagation(x, y, z, consistent)
+
+
+def propagation_events(x, y, z, names=("X", "Y", "Z"), level=2, reason="X*Y=Z"):
+    # Propagates a single X * Y = Z step by step, yielding a BoundsEvent for
+    # each bound that moves, ready for TracePlayer
+    bounds = dict(zip(names, _bounds_arrays(x, y, z)))
+    while True:
+        before = {n: b.copy() for n, b in bounds.items()}
+        new = propagate_step(*(bounds[n] for n in names))
+        bounds = dict(zip(names, new))
+        for name in names:
+            if (before[name] != bounds[name]).any():
+                lo, hi = bounds[name][0]
+                yield BoundsEvent(name, level, int(lo), int(hi), reason)
+        if any(b[0, 0] > b[0, 1] for b in bounds.values()):
+            return
+        if all((before[n] == bounds[n]).all() for n in names):
+            return
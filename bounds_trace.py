@@ -0,0 +1,70 @@
+# Replays bound-change traces (see bounds_events for the format) onto
+# BoundsBars.
+
+from manim import *
+
+from bounds_bar import BoundsSweep
+from bounds_events import (
+    BoundsEvent,
+    TraceWriter,
+    format_event,
+    parse_event,
+    read_trace,
+)
+
+
+class TracePlayer:
+    # Plays a stream of BoundsEvents onto BoundsBars (or TrackedBoundsBars),
+    # given as {var: bar}. Events that don't change anything are dropped, and
+    # a run of events for different variables becomes a single play call; an
+    # event for a variable already changing in the current batch starts a new
+    # one.
+    def __init__(self, scene, bars, run_time=0.5, **play_kwargs):
+        self.scene = scene
+        self.bars = bars
+        self.run_time = run_time
+        self.play_kwargs = play_kwargs
+        self.state = {var: self._initial_bounds(bar) for var, bar in bars.items()}
+        self.pending = {}
+        self.plays = 0
+        self.skipped = 0
+
+    def _initial_bounds(self, bar):
+        if hasattr(bar, "get_bounds"):
+            return [tuple(level) for level in np.rint(bar.get_bounds()).astype(int)]
+        return [tuple(level) for level in bar.bounds]
+
+    def _animation(self, var, bounds):
+        bar = self.bars[var]
+        if hasattr(bar, "set_bounds"):
+            return BoundsSweep(bar, [bounds], run_time=self.run_time)
+        return bar.animate(run_time=self.run_time).update_bounds(bounds)
+
+    def flush(self):
+        if self.pending:
+            self.scene.play(
+                *[self._animation(var, b) for var, b in self.pending.items()],
+                **self.play_kwargs,
+            )
+            self.plays += 1
+            self.pending = {}
+
+    def push(self, event):
+        if event.var not in self.bars:
+            raise KeyError(f"no bar for variable {event.var!r}")
+        bounds = list(self.state[event.var])
+        if bounds[event.level] == (event.lo, event.hi):
+            self.skipped += 1
+            return
+        bounds[event.level] = (event.lo, event.hi)
+
+        if event.var in self.pending:
+            self.flush()
+        self.state[event.var] = bounds
+        self.pending[event.var] = bounds
+
+    def play(self, events):
+        for event in events:
+            self.push(event)
+        self.flush()
+        return self.plays
@@ -1,11 +1,17 @@
 from .bullets import *
 from .constants import *
+from .tex_batch import *
+from .text_cache import *
 from .proof_scroll import *
 from .talk_header_footer import *
 from .circuit_graph import *
 from .proof_diagram import *
+from .catalogue import *
+from .glyph_pool import *
 from .global_constraints_list import *
 from .slide import *
 from .smart_table import *
+from .virtual_scroll import *
+from .raster_scroll import *
 
 from .match_code import *
@@ -0,0 +1,331 @@
+import argparse
+import importlib.util
+import inspect
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from manim import tempconfig
+from manim.constants import QUALITIES
+
+from .draft import DRAFT_FOLDER, draft_mode
+from .fingerprint import SceneFingerprinter
+from .profiling import write_build_report
+from .slide import TalkSlide
+from .tex_cache import DEFAULT_TEX_CACHE, DEFAULT_TEX_CACHE_BYTES, TexCache
+from .text_cache import DEFAULT_TEXT_CACHE, install_text_cache
+
+QUALITY_FLAGS = {q["flag"]: name for name, q in QUALITIES.items() if q["flag"]}
+
+
+def load_talk(talk_path):
+    talk_path = Path(talk_path).resolve()
+    # Talks import their neighbouring modules (e.g. bounds_bar) directly
+    if str(talk_path.parent) not in sys.path:
+        sys.path.insert(0, str(talk_path.parent))
+
+    spec = importlib.util.spec_from_file_location(talk_path.stem, talk_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[talk_path.stem] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def find_slides(module):
+    slides = [
+        obj
+        for obj in vars(module).values()
+        if inspect.isclass(obj)
+        and issubclass(obj, TalkSlide)
+        and obj.__module__ == module.__name__
+    ]
+    return sorted(slides, key=lambda s: inspect.getsourcelines(s)[1])
+
+
+def slides_are_complete(scene, slides_dir):
+    # manim-slides writes one JSON per scene, pointing at its segment videos
+    slide_path = slides_dir / f"{scene}.json"
+    if not slide_path.exists():
+        return False
+    try:
+        slides = json.loads(slide_path.read_text())["slides"]
+    except (ValueError, KeyError):
+        return False
+    cwd = slides_dir.parent
+    return all(
+        (cwd / s[key]).exists() for s in slides for key in ("file", "rev_file")
+    )
+
+
+class Manifest:
+    def __init__(self, path):
+        self.path = path
+        self.entries = json.loads(path.read_text()) if path.exists() else {}
+
+    def is_fresh(self, scene, fingerprint):
+        return self.entries.get(scene, {}).get("fingerprint") == fingerprint
+
+    def seconds(self, scene):
+        return self.entries.get(scene, {}).get("seconds", 0)
+
+    def record(self, scene, fingerprint, seconds):
+        self.entries[scene] = {"fingerprint": fingerprint, "seconds": seconds}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.entries, indent=2, sort_keys=True))
+
+
+def render_config(quality, fps=None):
+    settings = QUALITIES[quality]
+    return {
+        "pixel_width": settings["pixel_width"],
+        "pixel_height": settings["pixel_height"],
+        "frame_rate": fps if fps else settings["frame_rate"],
+        "progress_bar": "none",
+    }
+
+
+def worker_slots(context, jobs):
+    # The slot numbers _init_worker hands out, one per pool worker
+    slots = context.Queue()
+    for slot in range(jobs):
+        slots.put(slot)
+    return slots
+
+
+_talk = None
+_config = None
+_tex_cache = None
+
+
+def _init_worker(talk_path, build_dir, config, tex_cache, text_cache, slots):
+    global _talk, _config, _tex_cache
+
+    # Scenes load images relative to the talk, so work from there
+    os.chdir(Path(talk_path).parent)
+
+    # Each worker takes a slot number, so builds reuse build/worker-0 ...
+    # worker-<jobs - 1> rather than leaving a directory per process id
+    media_dir = Path(build_dir).resolve() / f"worker-{slots.get()}"
+    _config = dict(
+        config,
+        media_dir=str(media_dir),
+        tex_dir=str(media_dir / "Tex"),
+    )
+    _tex_cache = TexCache(*tex_cache).install()
+    install_text_cache(text_cache)
+    _talk = load_talk(talk_path)
+
+
+def _render_scene(name):
+    start = time.perf_counter()
+    latex_runs = _tex_cache.latex_runs
+    with tempconfig(_config):
+        getattr(_talk, name)().render()
+    return time.perf_counter() - start, _tex_cache.latex_runs - latex_runs
+
+
+def render_all(
+    talk_path,
+    scenes,
+    build_dir,
+    config,
+    jobs,
+    fingerprints,
+    manifest,
+    tex_cache,
+    text_cache,
+):
+    # Spawned workers each import the talk afresh, so no scene sees module
+    # state left behind by a scene rendered in the parent
+    context = multiprocessing.get_context("spawn")
+    timings = {}
+    failures = {}
+
+    # Longest scenes (as of the last build) first, so the slowest scene
+    # never starts last
+    scenes = sorted(scenes, key=manifest.seconds, reverse=True)
+
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(
+            str(talk_path),
+            str(build_dir),
+            config,
+            tex_cache,
+            text_cache,
+            worker_slots(context, jobs),
+        ),
+    ) as pool:
+        futures = {pool.submit(_render_scene, name): name for name in scenes}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                timings[name], latex_runs = future.result()
+                manifest.record(name, fingerprints[name], timings[name])
+                print(
+                    f"[{len(timings)}/{len(scenes)}] {name}: {timings[name]:.1f}s, "
+                    f"{latex_runs} LaTeX runs"
+                )
+            except Exception as e:
+                failures[name] = e
+                print(f"{name} failed: {e!r}", file=sys.stderr)
+
+    return timings, failures
+
+
+def convert(scenes, output, slides_dir):
+    subprocess.run(
+        [
+            "manim-slides",
+            "convert",
+            "--folder",
+            str(slides_dir),
+            *scenes,
+            str(output),
+        ],
+        check=True,
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m manim_beamer.build",
+        description="Render every TalkSlide in a talk across a process pool, "
+        "then convert the result with manim-slides.",
+    )
+    parser.add_argument("talk", help="talk module, e.g. aaai.py")
+    parser.add_argument(
+        "scenes",
+        nargs="*",
+        help="scenes to include, in deck order (default: every TalkSlide)",
+    )
+    parser.add_argument("-o", "--output", help="file to convert the deck to")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=os.cpu_count(), help="render workers"
+    )
+    parser.add_argument(
+        "-q", "--quality", choices=QUALITY_FLAGS, default="h", help="render quality"
+    )
+    parser.add_argument("--fps", type=int, help="override the quality's frame rate")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="re-render scenes even if their fingerprint is unchanged",
+    )
+    parser.add_argument(
+        "--tex-cache",
+        default=DEFAULT_TEX_CACHE,
+        help="LaTeX output cache shared by all workers and builds",
+    )
+    parser.add_argument(
+        "--tex-cache-mb",
+        type=int,
+        default=DEFAULT_TEX_CACHE_BYTES // 2**20,
+        help="disk budget of the LaTeX cache",
+    )
+    parser.add_argument(
+        "--text-cache",
+        default=DEFAULT_TEXT_CACHE,
+        help="Pango text outlines shared by all workers and builds",
+    )
+    parser.add_argument(
+        "--build-dir",
+        default="build",
+        help="per-worker media directories, relative to the talk",
+    )
+    parser.add_argument(
+        "--draft",
+        nargs="?",
+        const="1",
+        choices=["1", "placeholders"],
+        help="render at draft resolution and frame rate, without wait holds; "
+        "'placeholders' also swaps images and new TeX for boxes",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="time each rendered scene and write a report to <build-dir>/profile",
+    )
+    args = parser.parse_args(argv)
+
+    talk_path = Path(args.talk).resolve()
+    talk_dir = talk_path.parent
+    build_dir = talk_dir / args.build_dir
+
+    module = load_talk(talk_path)
+    available = [s.__name__ for s in find_slides(module)]
+    scenes = args.scenes or available
+
+    unknown = [s for s in scenes if s not in available]
+    if unknown:
+        parser.error(f"no TalkSlide named {', '.join(unknown)} in {args.talk}")
+
+    config = render_config(QUALITY_FLAGS[args.quality], args.fps)
+    slides_dir = talk_dir / "slides"
+    manifest = Manifest(build_dir / "manifest.json")
+    if args.draft:
+        # Workers inherit the environment; TalkSlide picks this up and writes
+        # to the draft folder, so a draft never stands in for a final render
+        os.environ["MANIM_BEAMER_DRAFT"] = args.draft
+        slides_dir = talk_dir / DRAFT_FOLDER
+        manifest = Manifest(build_dir / "manifest-draft.json")
+
+    # Each scene's own draft mode (a slide can pin draft = False or True)
+    # is part of its fingerprint
+    fingerprinter = SceneFingerprinter(module, config)
+    fingerprints = {
+        s: fingerprinter.fingerprint(getattr(module, s), draft_mode(getattr(module, s)))
+        for s in scenes
+    }
+    stale = [
+        s
+        for s in scenes
+        if args.force
+        or not manifest.is_fresh(s, fingerprints[s])
+        or not slides_are_complete(s, slides_dir)
+    ]
+    if len(stale) < len(scenes):
+        print(f"Reusing {len(scenes) - len(stale)} unchanged scenes")
+
+    if args.profile:
+        os.environ["MANIM_BEAMER_PROFILE"] = str(build_dir / "profile")
+
+    start = time.perf_counter()
+    timings, failures = {}, {}
+    if stale:
+        timings, failures = render_all(
+            talk_path,
+            stale,
+            build_dir,
+            config,
+            min(args.jobs, len(stale)),
+            fingerprints,
+            manifest,
+            (str(args.tex_cache), args.tex_cache_mb * 2**20),
+            str(args.text_cache),
+        )
+    print(
+        f"Rendered {len(timings)} scenes in {time.perf_counter() - start:.1f}s "
+        f"({sum(timings.values()):.1f}s of scene time)"
+    )
+
+    if args.profile and write_build_report(build_dir / "profile", timings):
+        print(f"Wrote profile to {build_dir / 'profile'}")
+
+    if failures:
+        return 1
+
+    if args.output:
+        convert(scenes, Path(args.output).resolve(), slides_dir)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
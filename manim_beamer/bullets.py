@@ -2,6 +2,7 @@ from manim import *
 from manim_slides import Slide
 
 from .constants import *
+from .text_cache import cached_text
 
 class BulletPoints(VGroup):
     def __init__(self, *text, bullet_style="SQUARE", bullet_color=UG_BLUE, bullet_space=1, line_space=0.5, **kwargs):
@@ -13,7 +14,7 @@ class BulletPoints(VGroup):
         }
         bulleted_text = ["".join([bullet_unicode[bullet_style], " " + " "*bullet_space, t]).replace("\n", "\n   " + " "*bullet_space) for t in text]
 
-        self.bullet_texts = VGroup(*[MarkupText(b, **kwargs) for b in bulleted_text]).arrange(DOWN, buff=line_space, center=False, aligned_edge=LEFT)
+        self.bullet_texts = VGroup(*[cached_text(b, MarkupText, **kwargs) for b in bulleted_text]).arrange(DOWN, buff=line_space, center=False, aligned_edge=LEFT)
 
         [b[0].set_color(UG_BLUE) for b in self.bullet_texts]
         self.add(self.bullet_texts)
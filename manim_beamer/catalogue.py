@@ -0,0 +1,100 @@
+import csv
+from array import array
+from collections.abc import Sequence
+from itertools import islice
+from pathlib import Path
+
+TEX_SPECIALS = {
+    "\\": r"\textbackslash{}",
+    "{": r"\{",
+    "}": r"\}",
+    "_": r"\_",
+    "&": r"\&",
+    "%": r"\%",
+    "$": r"\$",
+    "#": r"\#",
+    "^": r"\^{}",
+    "~": r"\~{}",
+}
+
+
+def texttt(name):
+    # One catalogue entry as a MathTex line
+    return r"\texttt{%s}\\" % "".join(TEX_SPECIALS.get(c, c) for c in name)
+
+
+def _parse_line(line, is_csv):
+    # The name on one line of a catalogue file, or None for blank lines and
+    # comments. CSV files take the first column and may have a "name" header.
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    if is_csv:
+        row = next(csv.reader([line]), None)
+        if not row or row[0].strip().lower() == "name":
+            return None
+        return row[0].strip()
+    return line
+
+
+def read_names(path):
+    # Streams the names in a .txt (one per line) or .csv catalogue file
+    is_csv = Path(path).suffix.lower() == ".csv"
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            name = _parse_line(line, is_csv)
+            if name is not None:
+                yield name
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class Catalogue(Sequence):
+    # A catalogue file as a lazy sequence of formatted entries. Nothing is read
+    # until it is used; then only the byte offset of each entry is kept, and
+    # entries are read and formatted when indexed, so scroll components can
+    # page through catalogues of any size.
+
+    def __init__(self, path, format=texttt):
+        self.path = Path(path)
+        self.format = format
+        self.is_csv = self.path.suffix.lower() == ".csv"
+        self._offsets = None
+
+    @property
+    def data_files(self):
+        return [self.path]
+
+    def _index(self):
+        if self._offsets is None:
+            offsets = array("q")
+            with open(self.path, "rb") as f:
+                position = 0
+                for line in f:
+                    if _parse_line(line.decode("utf-8"), self.is_csv) is not None:
+                        offsets.append(position)
+                    position += len(line)
+            self._offsets = offsets
+        return self._offsets
+
+    def __len__(self):
+        return len(self._index())
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        offsets = self._index()
+        with open(self.path, "rb") as f:
+            f.seek(offsets[i])
+            return self.format(_parse_line(f.readline().decode("utf-8"), self.is_csv))
+
+    def __iter__(self):
+        # Straight through the file, without building the index
+        return map(self.format, read_names(self.path))
+
+    def __repr__(self):
+        return f"Catalogue({str(self.path)!r})"
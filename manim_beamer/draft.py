@@ -0,0 +1,116 @@
+import hashlib
+import os
+import re
+from contextlib import contextmanager
+from functools import wraps
+
+from manim import *
+from manim.mobject.text import tex_mobject
+from manim.utils.images import get_full_raster_image_path
+from PIL import Image
+
+from . import tex_batch
+
+# Enough to check layout and timing, cheap enough that a whole deck renders
+# in seconds
+DRAFT_CONFIG = {"pixel_width": 480, "pixel_height": 270, "frame_rate": 10}
+
+PLACEHOLDER_RGBA = (160, 160, 160, 255)
+
+# Draft builds write their slides here rather than to manim-slides' slides/
+DRAFT_FOLDER = "slides-draft"
+
+# A control sequence counts as one glyph; grouping and script markers as none
+TEX_GLYPH = re.compile(r"\\[a-zA-Z]+|\\.|[^\s{}^_&]")
+
+
+def draft_mode(scene):
+    # False, True or "placeholders". A slide's own draft attribute wins over
+    # MANIM_BEAMER_DRAFT, so draft = False pins it to full quality.
+    if scene.draft is not None:
+        return scene.draft
+    if not draft_build():
+        return False
+    setting = os.environ["MANIM_BEAMER_DRAFT"].strip().lower()
+    return "placeholders" if setting == "placeholders" else True
+
+
+def draft_build():
+    # Whether this is a draft build (MANIM_BEAMER_DRAFT set), whatever any
+    # single slide says
+    setting = os.environ.get("MANIM_BEAMER_DRAFT", "").strip().lower()
+    return setting not in ("", "0", "false", "no")
+
+
+def _placeholder_image(init):
+    # Same size on screen, but a single pixel instead of a decoded bitmap
+    @wraps(init)
+    def wrapper(self, filename_or_array, *args, **kwargs):
+        if args or not isinstance(filename_or_array, (str, os.PathLike)):
+            return init(self, filename_or_array, *args, **kwargs)
+
+        with Image.open(get_full_raster_image_path(filename_or_array)) as image:
+            width, height = image.size
+        scale_to_resolution = kwargs.pop(
+            "scale_to_resolution", QUALITIES[DEFAULT_QUALITY]["pixel_height"]
+        )
+        init(
+            self,
+            np.array([[PLACEHOLDER_RGBA]], dtype=np.uint8),
+            scale_to_resolution=scale_to_resolution / height,
+            **kwargs,
+        )
+        self.stretch_to_fit_width(self.height * width / height)
+
+    return wrapper
+
+
+def _placeholder_svg(expression):
+    # One box per glyph-ish token, so indexing into the MathTex still mostly
+    # works, laid out roughly where LaTeX would put them
+    glyphs = TEX_GLYPH.findall(expression) or ["."]
+    boxes = "".join(
+        f'<rect x="{i * 6}" y="0" width="5" height="8" fill="black"/>'
+        for i in range(len(glyphs))
+    )
+    return (
+        '<svg xmlns="http://www.w3.org/2000/svg" '
+        f'viewBox="0 0 {len(glyphs) * 6} 8">{boxes}</svg>'
+    )
+
+
+def _placeholder_tex(typeset):
+    # Anything already typeset is used as is; everything else gets boxes
+    # instead of a LaTeX run
+    @wraps(typeset)
+    def wrapper(expression, environment=None, tex_template=None):
+        if tex_batch.is_typeset(expression, environment, tex_template):
+            return typeset(expression, environment, tex_template)
+        tex_dir = config.get_dir("tex_dir")
+        tex_dir.mkdir(parents=True, exist_ok=True)
+        svg = _placeholder_svg(expression)
+        path = tex_dir / f"draft-{hashlib.sha256(svg.encode()).hexdigest()[:16]}.svg"
+        if not path.exists():
+            path.write_text(svg)
+        return path
+
+    return wrapper
+
+
+@contextmanager
+def placeholders():
+    patched = [
+        (ImageMobject, "__init__", _placeholder_image),
+        (tex_mobject, "tex_to_svg_file", _placeholder_tex),
+        # Leave every request to the placeholder hook above rather than
+        # batching it through LaTeX
+        (tex_batch, "typeset_batch", lambda typeset_batch: list),
+    ]
+    originals = [(owner, name, getattr(owner, name)) for owner, name, _ in patched]
+    for owner, name, wrap in patched:
+        setattr(owner, name, wrap(getattr(owner, name)))
+    try:
+        yield
+    finally:
+        for owner, name, original in originals:
+            setattr(owner, name, original)
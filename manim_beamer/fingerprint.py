@@ -0,0 +1,162 @@
+import ast
+import hashlib
+import importlib.util
+import inspect
+import json
+import sys
+from pathlib import Path
+
+import manim
+
+LITERAL_TYPES = (str, int, float, bool, list, tuple, dict)
+
+# The build's own output, never an input to a scene
+OUTPUT_DIRS = ("build", "slides", "slides-draft", "media")
+
+
+def _is_local(path, root):
+    try:
+        Path(path).resolve().relative_to(root)
+        return True
+    except ValueError:
+        return False
+
+
+def _imported_modules(module):
+    # Names of the modules a module imports, with relative imports resolved
+    tree = ast.parse(inspect.getsource(module))
+    package = module.__package__ or ""
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                yield alias.name
+        elif isinstance(node, ast.ImportFrom):
+            name = "." * node.level + (node.module or "")
+            yield importlib.util.resolve_name(name, package) if node.level else name
+
+
+def _string_constants(source):
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            yield node.value
+
+
+def _referenced_names(source):
+    return {
+        node.id
+        for node in ast.walk(ast.parse(source))
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load)
+    }
+
+
+class SceneFingerprinter:
+    def __init__(self, module, config):
+        self.module = module
+        self.root = Path(module.__file__).resolve().parent
+        self.config = json.dumps(
+            {"manim": manim.__version__, **config}, sort_keys=True, default=str
+        )
+
+        # Module-level statements (imports, the shared HeaderFooter,
+        # constants) can affect any scene, so every scene depends on them
+        source = inspect.getsource(module)
+        self.preamble = "\n".join(
+            ast.get_source_segment(source, node)
+            for node in ast.parse(source).body
+            if not isinstance(node, (ast.ClassDef, ast.FunctionDef))
+        )
+
+    def _local_module_closure(self, names):
+        seen = set()
+        todo = list(names)
+        while todo:
+            name = todo.pop()
+            module = sys.modules.get(name)
+            if name in seen or name == self.module.__name__ or module is None:
+                continue
+            if not _is_local(getattr(module, "__file__", None) or "/", self.root):
+                continue
+            seen.add(name)
+            todo.extend(_imported_modules(module))
+        return seen
+
+    def _assets(self, sources):
+        # String constants naming a file with an extension ("img/bug.png"), or
+        # a directory a scene lists ("./img/bugs"), whose files then all
+        # count; never the talk directory itself, the output directories or
+        # a package, whose modules the import closure already covers
+        outputs = [self.root / d for d in OUTPUT_DIRS]
+        assets = set()
+        for source in sources:
+            for s in _string_constants(source):
+                if not s or len(s) > 255 or "\n" in s:
+                    continue
+                path = (self.root / s).resolve()
+                if path == self.root or not _is_local(path, self.root):
+                    continue
+                if any(_is_local(path, d) for d in outputs):
+                    continue
+                if path.is_dir():
+                    if (path / "__init__.py").exists():
+                        continue
+                    assets.update(p for p in path.iterdir() if p.is_file())
+                elif path.suffix and path.is_file():
+                    assets.add(path)
+        return sorted(assets)
+
+    def fingerprint(self, scene_cls, *extra):
+        # extra: anything else the render depends on, e.g. its draft mode
+        hasher = hashlib.sha256()
+
+        def update(*parts):
+            for part in parts:
+                hasher.update(part if isinstance(part, bytes) else str(part).encode())
+                hasher.update(b"\0")
+
+        update(self.config, self.preamble, inspect.getsource(scene_cls), *extra)
+
+        # Follow the names the scene uses: talk-level helpers contribute their
+        # source, literal constants their value, and anything defined in a
+        # local module (manim_beamer, bounds_bar, ...) the module itself
+        module_names = set()
+        seen = set()
+        todo = sorted(_referenced_names(inspect.getsource(scene_cls)))
+        for base in scene_cls.__mro__[1:]:
+            if base.__module__ == self.module.__name__:
+                todo.append(base.__name__)
+            else:
+                module_names.add(base.__module__)
+
+        while todo:
+            name = todo.pop()
+            if name in seen or name not in vars(self.module):
+                continue
+            seen.add(name)
+            obj = vars(self.module)[name]
+
+            if inspect.isclass(obj) or inspect.isfunction(obj):
+                if obj.__module__ == self.module.__name__:
+                    source = inspect.getsource(obj)
+                    update(name, source)
+                    todo.extend(sorted(_referenced_names(source)))
+                else:
+                    module_names.add(obj.__module__)
+            elif isinstance(obj, LITERAL_TYPES):
+                update(name, repr(obj))
+            else:
+                module_names.add(type(obj).__module__)
+                # Lazily loaded data (e.g. a Catalogue) names the files it reads
+                for path in getattr(obj, "data_files", ()):
+                    update(Path(path).name, Path(path).read_bytes())
+
+        modules = sorted(self._local_module_closure(module_names))
+        sources = [inspect.getsource(scene_cls), self.preamble]
+        for name in modules:
+            source = inspect.getsource(sys.modules[name])
+            sources.append(source)
+            update(name, source)
+
+        for asset in self._assets(sources):
+            update(asset.relative_to(self.root), asset.read_bytes())
+
+        return hasher.hexdigest()
@@ -1,425 +1,6 @@
-big_constraints_list = [
-    r"\texttt{abs\_value}\\",
-    r"\texttt{all\_differ\_from\_at\_least\_k\_pos}\\",
-    r"\texttt{all\_differ\_from\_at\_most\_k\_pos}\\",
-    r"\texttt{all\_differ\_from\_exactly\_k\_pos}\\",
-    r"\texttt{all\_equal}\\",
-    r"\texttt{all\_equal\_peak}\\",
-    r"\texttt{all\_equal\_peak\_max}\\",
-    r"\texttt{all\_equal\_valley}\\",
-    r"\texttt{all\_equal\_valley\_min}\\",
-    r"\texttt{all\_incomparable}\\",
-    r"\texttt{all\_min\_dist}\\",
-    r"\texttt{alldifferent}\\",
-    r"\texttt{alldifferent\_between\_sets}\\",
-    r"\texttt{alldifferent\_consecutive\_values}\\",
-    r"\texttt{alldifferent\_cst}\\",
-    r"\texttt{alldifferent\_except\_0}\\",
-    r"\texttt{alldifferent\_interval}\\",
-    r"\texttt{alldifferent\_modulo}\\",
-    r"\texttt{alldifferent\_on\_intersection}\\",
-    r"\texttt{alldifferent\_partition}\\",
-    r"\texttt{alldifferent\_same\_value}\\",
-    r"\texttt{allperm}\\",
-    r"\texttt{among}\\",
-    r"\texttt{among\_diff\_0}\\",
-    r"\texttt{among\_interval}\\",
-    r"\texttt{among\_low\_up}\\",
-    r"\texttt{among\_modulo}\\",
-    r"\texttt{among\_seq}\\",
-    r"\texttt{among\_var}\\",
-    r"\texttt{and}\\",
-    r"\texttt{arith}\\",
-    r"\texttt{arith\_or}\\",
-    r"\texttt{arith\_sliding}\\",
-    r"\texttt{assign\_and\_counts}\\",
-    r"\texttt{assign\_and\_nvalues}\\",
-    r"\texttt{atleast}\\",
-    r"\texttt{atleast\_nvalue}\\",
-    r"\texttt{atleast\_nvector}\\",
-    r"\texttt{atmost}\\",
-    r"\texttt{atmost1}\\",
-    r"\texttt{atmost\_nvalue}\\",
-    r"\texttt{atmost\_nvector}\\",
-    r"\texttt{balance}\\",
-    r"\texttt{balance\_cycle}\\",
-    r"\texttt{balance\_interval}\\",
-    r"\texttt{balance\_modulo}\\",
-    r"\texttt{balance\_partition}\\",
-    r"\texttt{balance\_path}\\",
-    r"\texttt{balance\_tree}\\",
-    r"\texttt{between\_min\_max}\\",
-    r"\texttt{big\_peak}\\",
-    r"\texttt{big\_valley}\\",
-    r"\texttt{bin\_packing}\\",
-    r"\texttt{bin\_packing\_capa}\\",
-    r"\texttt{binary\_tree}\\",
-    r"\texttt{bipartite}\\",
-    r"\texttt{calendar}\\",
-    r"\texttt{cardinality\_atleast}\\",
-    r"\texttt{cardinality\_atmost}\\",
-    r"\texttt{cardinality\_atmost\_partition}\\",
-    r"\texttt{change}\\",
-    r"\texttt{change\_continuity}\\",
-    r"\texttt{change\_pair}\\",
-    r"\texttt{change\_partition}\\",
-    r"\texttt{change\_vectors}\\",
-    r"\texttt{circuit}\\",
-    r"\texttt{circuit\_cluster}\\",
-    r"\texttt{circular\_change}\\",
-    r"\texttt{clause\_and}\\",
-    r"\texttt{clause\_or}\\",
-    r"\texttt{clique}\\",
-    r"\texttt{colored\_matrix}\\",
-    r"\texttt{coloured\_cumulative}\\",
-    r"\texttt{coloured\_cumulatives}\\",
-    r"\texttt{common}\\",
-    r"\texttt{common\_interval}\\",
-    r"\texttt{common\_modulo}\\",
-    r"\texttt{common\_partition}\\",
-    r"\texttt{compare\_and\_count}\\",
-    r"\texttt{cond\_lex\_cost}\\",
-    r"\texttt{cond\_lex\_greater}\\",
-    r"\texttt{cond\_lex\_greatereq}\\",
-    r"\texttt{cond\_lex\_less}\\",
-    r"\texttt{cond\_lex\_lesseq}\\",
-    r"\texttt{connect\_points}\\",
-    r"\texttt{connected}\\",
-    r"\texttt{consecutive\_groups\_of\_ones}\\",
-    r"\texttt{consecutive\_values}\\",
-    r"\texttt{contains\_sboxes}\\",
-    r"\texttt{correspondence}\\",
-    r"\texttt{count}\\",
-    r"\texttt{counts}\\",
-    r"\texttt{coveredby\_sboxes}\\",
-    r"\texttt{covers\_sboxes}\\",
-    r"\texttt{crossing}\\",
-    r"\texttt{cumulative}\\",
-    r"\texttt{cumulative\_convex}\\",
-    r"\texttt{cumulative\_product}\\",
-    r"\texttt{cumulative\_two\_d}\\",
-    r"\texttt{cumulative\_with\_level\_of\_priority}\\",
-    r"\texttt{cumulatives}\\",
-    r"\texttt{cutset}\\",
-    r"\texttt{cycle}\\",
-    r"\texttt{cycle\_card\_on\_path}\\",
-    r"\texttt{cycle\_or\_accessibility}\\",
-    r"\texttt{cycle\_resource}\\",
-    r"\texttt{cyclic\_change}\\",
-    r"\texttt{cyclic\_change\_joker}\\",
-    r"\texttt{dag}\\",
-    r"\texttt{decreasing}\\",
-    r"\texttt{decreasing\_peak}\\",
-    r"\texttt{decreasing\_valley}\\",
-    r"\texttt{deepest\_valley}\\",
-    r"\texttt{derangement}\\",
-    r"\texttt{differ\_from\_at\_least\_k\_pos}\\",
-    r"\texttt{differ\_from\_at\_most\_k\_pos}\\",
-    r"\texttt{differ\_from\_exactly\_k\_pos}\\",
-    r"\texttt{diffn}\\",
-    r"\texttt{diffn\_column}\\",
-    r"\texttt{diffn\_include}\\",
-    r"\texttt{discrepancy}\\",
-    r"\texttt{disj}\\",
-    r"\texttt{disjoint}\\",
-    r"\texttt{disjoint\_sboxes}\\",
-    r"\texttt{disjoint\_tasks}\\",
-    r"\texttt{disjunctive}\\",
-    r"\texttt{disjunctive\_or\_same\_end}\\",
-    r"\texttt{disjunctive\_or\_same\_start}\\",
-    r"\texttt{distance}\\",
-    r"\texttt{distance\_between}\\",
-    r"\texttt{distance\_change}\\",
-    r"\texttt{divisible}\\",
-    r"\texttt{divisible\_or}\\",
-    r"\texttt{dom\_reachability}\\",
-    r"\texttt{domain}\\",
-    r"\texttt{domain\_constraint}\\",
-    r"\texttt{elem}\\",
-    r"\texttt{elem\_from\_to}\\",
-    r"\texttt{element}\\",
-    r"\texttt{element\_greatereq}\\",
-    r"\texttt{element\_lesseq}\\",
-    r"\texttt{element\_matrix}\\",
-    r"\texttt{element\_product}\\",
-    r"\texttt{element\_sparse}\\",
-    r"\texttt{elementn}\\",
-    r"\texttt{elements}\\",
-    r"\texttt{elements\_alldifferent}\\",
-    r"\texttt{elements\_sparse}\\",
-    r"\texttt{eq}\\",
-    r"\texttt{eq\_cst}\\",
-    r"\texttt{eq\_set}\\",
-    r"\texttt{equal\_sboxes}\\",
-    r"\texttt{equilibrium}\\",
-    r"\texttt{equivalent}\\",
-    r"\texttt{exactly}\\",
-    r"\texttt{first\_value\_diff\_0}\\",
-    r"\texttt{full\_group}\\",
-    r"\texttt{gcd}\\",
-    r"\texttt{geost}\\",
-    r"\texttt{geost\_time}\\",
-    r"\texttt{geq}\\",
-    r"\texttt{geq\_cst}\\",
-    r"\texttt{global\_cardinality}\\",
-    r"\texttt{global\_cardinality\_low\_up}\\",
-    r"\texttt{global\_cardinality\_low\_up\_no\_loop}\\",
-    r"\texttt{global\_cardinality\_no\_loop}\\",
-    r"\texttt{global\_cardinality\_with\_costs}\\",
-    r"\texttt{global\_contiguity}\\",
-    r"\texttt{golomb}\\",
-    r"\texttt{graph\_crossing}\\",
-    r"\texttt{graph\_isomorphism}\\",
-    r"\texttt{group}\\",
-    r"\texttt{group\_skip\_isolated\_item}\\",
-    r"\texttt{gt}\\",
-    r"\texttt{highest\_peak}\\",
-    r"\texttt{imply}\\",
-    r"\texttt{in}\\",
-    r"\texttt{in\_interval}\\",
-    r"\texttt{in\_interval\_reified}\\",
-    r"\texttt{in\_intervals}\\",
-    r"\texttt{in\_relation}\\",
-    r"\texttt{in\_same\_partition}\\",
-    r"\texttt{in\_set}\\",
-    r"\texttt{incomparable}\\",
-    r"\texttt{increasing}\\",
-    r"\texttt{increasing\_global\_cardinality}\\",
-    r"\texttt{increasing\_nvalue}\\",
-    r"\texttt{increasing\_nvalue\_chain}\\",
-    r"\texttt{increasing\_peak}\\",
-    r"\texttt{increasing\_sum}\\",
-    r"\texttt{increasing\_valley}\\",
-    r"\texttt{indexed\_sum}\\",
-    r"\texttt{inflexion}\\",
-    r"\texttt{inside\_sboxes}\\",
-    r"\texttt{int\_value\_precede}\\",
-    r"\texttt{int\_value\_precede\_chain}\\",
-    r"\texttt{interval\_and\_count}\\",
-    r"\texttt{interval\_and\_sum}\\",
-    r"\texttt{inverse}\\",
-    r"\texttt{inverse\_offset}\\",
-    r"\texttt{inverse\_set}\\",
-    r"\texttt{inverse\_within\_range}\\",
-    r"\texttt{ith\_pos\_different\_from\_0}\\",
-    r"\texttt{k\_alldifferent}\\",
-    r"\texttt{k\_cut}\\",
-    r"\texttt{k\_disjoint}\\",
-    r"\texttt{k\_same}\\",
-    r"\texttt{k\_same\_interval}\\",
-    r"\texttt{k\_same\_modulo}\\",
-    r"\texttt{k\_same\_partition}\\",
-    r"\texttt{k\_used\_by}\\",
-    r"\texttt{k\_used\_by\_interval}\\",
-    r"\texttt{k\_used\_by\_modulo}\\",
-    r"\texttt{k\_used\_by\_partition}\\",
-    r"\texttt{length\_first\_sequence}\\",
-    r"\texttt{length\_last\_sequence}\\",
-    r"\texttt{leq}\\",
-    r"\texttt{leq\_cst}\\",
-    r"\texttt{lex2}\\",
-    r"\texttt{lex\_alldifferent}\\",
-    r"\texttt{lex\_alldifferent\_except\_0}\\",
-    r"\texttt{lex\_between}\\",
-    r"\texttt{lex\_chain\_greater}\\",
-    r"\texttt{lex\_chain\_greatereq}\\",
-    r"\texttt{lex\_chain\_less}\\",
-    r"\texttt{lex\_chain\_lesseq}\\",
-    r"\texttt{lex\_different}\\",
-    r"\texttt{lex\_equal}\\",
-    r"\texttt{lex\_greater}\\",
-    r"\texttt{lex\_greatereq}\\",
-    r"\texttt{lex\_less}\\",
-    r"\texttt{lex\_lesseq}\\",
-    r"\texttt{lex\_lesseq\_allperm}\\",
-    r"\texttt{link\_set\_to\_booleans}\\",
-    r"\texttt{longest\_change}\\",
-    r"\texttt{longest\_decreasing\_sequence}\\",
-    r"\texttt{longest\_increasing\_sequence}\\",
-    r"\texttt{lt}\\",
-    r"\texttt{map}\\",
-    r"\texttt{max\_decreasing\_slope}\\",
-    r"\texttt{max\_increasing\_slope}\\",
-    r"\texttt{max\_index}\\",
-    r"\texttt{max\_n}\\",
-    r"\texttt{max\_nvalue}\\",
-    r"\texttt{max\_occ\_of\_consecutive\_tuples\_of\_values}\\",
-    r"\texttt{max\_occ\_of\_sorted\_tuples\_of\_values}\\",
-    r"\texttt{max\_occ\_of\_tuples\_of\_values}\\",
-    r"\texttt{max\_size\_set\_of\_consecutive\_var}\\",
-    r"\texttt{maximum}\\",
-    r"\texttt{maximum\_modulo}\\",
-    r"\texttt{meet\_sboxes}\\",
-    r"\texttt{min\_decreasing\_slope}\\",
-    r"\texttt{min\_dist\_between\_inflexion}\\",
-    r"\texttt{min\_increasing\_slope}\\",
-    r"\texttt{min\_index}\\",
-    r"\texttt{min\_n}\\",
-    r"\texttt{min\_nvalue}\\",
-    r"\texttt{min\_size\_full\_zero\_stretch}\\",
-    r"\texttt{min\_size\_set\_of\_consecutive\_var}\\",
-    r"\texttt{min\_width\_peak}\\",
-    r"\texttt{min\_width\_valley}\\",
-    r"\texttt{minimum}\\",
-    r"\texttt{minimum\_except\_0}\\",
-    r"\texttt{minimum\_greater\_than}\\",
-    r"\texttt{minimum\_modulo}\\",
-    r"\texttt{minimum\_weight\_alldifferent}\\",
-    r"\texttt{multi\_global\_contiguity}\\",
-    r"\texttt{multi\_inter\_distance}\\",
-    r"\texttt{multiple}\\",
-    r"\texttt{nand}\\",
-    r"\texttt{nclass}\\",
-    r"\texttt{neq}\\",
-    r"\texttt{neq\_cst}\\",
-    r"\texttt{nequivalence}\\",
-    r"\texttt{next\_element}\\",
-    r"\texttt{next\_greater\_element}\\",
-    r"\texttt{ninterval}\\",
-    r"\texttt{no\_peak}\\",
-    r"\texttt{no\_valley}\\",
-    r"\texttt{non\_overlap\_sboxes}\\",
-    r"\texttt{nor}\\",
-    r"\texttt{not\_all\_equal}\\",
-    r"\texttt{not\_in}\\",
-    r"\texttt{npair}\\",
-    r"\texttt{nset\_of\_consecutive\_values}\\",
-    r"\texttt{nvalue}\\",
-    r"\texttt{nvalue\_on\_intersection}\\",
-    r"\texttt{nvalues}\\",
-    r"\texttt{nvalues\_except\_0}\\",
-    r"\texttt{nvector}\\",
-    r"\texttt{nvectors}\\",
-    r"\texttt{nvisible\_from\_end}\\",
-    r"\texttt{nvisible\_from\_start}\\",
-    r"\texttt{open\_alldifferent}\\",
-    r"\texttt{open\_among}\\",
-    r"\texttt{open\_atleast}\\",
-    r"\texttt{open\_atmost}\\",
-    r"\texttt{open\_global\_cardinality}\\",
-    r"\texttt{open\_global\_cardinality\_low\_up}\\",
-    r"\texttt{open\_maximum}\\",
-    r"\texttt{open\_minimum}\\",
-    r"\texttt{opposite\_sign}\\",
-    r"\texttt{or}\\",
-    r"\texttt{orchard}\\",
-    r"\texttt{order}\\",
-    r"\texttt{ordered\_atleast\_nvector}\\",
-    r"\texttt{ordered\_atmost\_nvector}\\",
-    r"\texttt{ordered\_global\_cardinality}\\",
-    r"\texttt{ordered\_nvector}\\",
-    r"\texttt{orth\_link\_ori\_siz\_end}\\",
-    r"\texttt{orth\_on\_the\_ground}\\",
-    r"\texttt{orth\_on\_top\_of\_orth}\\",
-    r"\texttt{orths\_are\_connected}\\",
-    r"\texttt{overlap\_sboxes}\\",
-    r"\texttt{path}\\",
-    r"\texttt{path\_from\_to}\\",
-    r"\texttt{pattern}\\",
-    r"\texttt{peak}\\",
-    r"\texttt{period}\\",
-    r"\texttt{period\_except\_0}\\",
-    r"\texttt{period\_vectors}\\",
-    r"\texttt{permutation}\\",
-    r"\texttt{place\_in\_pyramid}\\",
-    r"\texttt{polyomino}\\",
-    r"\texttt{power}\\",
-    r"\texttt{precedence}\\",
-    r"\texttt{product\_ctr}\\",
-    r"\texttt{proper\_circuit}\\",
-    r"\texttt{proper\_forest}\\",
-    r"\texttt{range\_ctr}\\",
-    r"\texttt{relaxed\_sliding\_sum}\\",
-    r"\texttt{remainder}\\",
-    r"\texttt{roots}\\",
-    r"\texttt{same}\\",
-    r"\texttt{same\_and\_global\_cardinality}\\",
-    r"\texttt{same\_and\_global\_cardinality\_low\_up}\\",
-    r"\texttt{same\_intersection}\\",
-    r"\texttt{same\_interval}\\",
-    r"\texttt{same\_modulo}\\",
-    r"\texttt{same\_partition}\\",
-    r"\texttt{same\_sign}\\",
-    r"\texttt{scalar\_product}\\",
-    r"\texttt{sequence\_folding}\\",
-    r"\texttt{set\_value\_precede}\\",
-    r"\texttt{shift}\\",
-    r"\texttt{sign\_of}\\",
-    r"\texttt{size\_max\_seq\_alldifferent}\\",
-    r"\texttt{size\_max\_starting\_seq\_alldifferent}\\",
-    r"\texttt{sliding\_card\_skip0}\\",
-    r"\texttt{sliding\_distribution}\\",
-    r"\texttt{sliding\_sum}\\",
-    r"\texttt{sliding\_time\_window}\\",
-    r"\texttt{sliding\_time\_window\_from\_start}\\",
-    r"\texttt{sliding\_time\_window\_sum}\\",
-    r"\texttt{smooth}\\",
-    r"\texttt{soft\_all\_equal\_max\_var}\\",
-    r"\texttt{soft\_all\_equal\_min\_ctr}\\",
-    r"\texttt{soft\_all\_equal\_min\_var}\\",
-    r"\texttt{soft\_alldifferent\_ctr}\\",
-    r"\texttt{soft\_alldifferent\_var}\\",
-    r"\texttt{soft\_cumulative}\\",
-    r"\texttt{soft\_same\_interval\_var}\\",
-    r"\texttt{soft\_same\_modulo\_var}\\",
-    r"\texttt{soft\_same\_partition\_var}\\",
-    r"\texttt{soft\_same\_var}\\",
-    r"\texttt{soft\_used\_by\_interval\_var}\\",
-    r"\texttt{soft\_used\_by\_modulo\_var}\\",
-    r"\texttt{soft\_used\_by\_partition\_var}\\",
-    r"\texttt{soft\_used\_by\_var}\\",
-    r"\texttt{some\_equal}\\",
-    r"\texttt{sort}\\",
-    r"\texttt{sort\_permutation}\\",
-    r"\texttt{stable\_compatibility}\\",
-    r"\texttt{stage\_element}\\",
-    r"\texttt{stretch\_circuit}\\",
-    r"\texttt{stretch\_path}\\",
-    r"\texttt{stretch\_path\_partition}\\",
-    r"\texttt{strict\_lex2}\\",
-    r"\texttt{strictly\_decreasing}\\",
-    r"\texttt{strictly\_increasing}\\",
-    r"\texttt{strongly\_connected}\\",
-    r"\texttt{subgraph\_isomorphism}\\",
-    r"\texttt{sum}\\",
-    r"\texttt{sum\_ctr}\\",
-    r"\texttt{sum\_cubes\_ctr}\\",
-    r"\texttt{sum\_free}\\",
-    r"\texttt{sum\_of\_increments}\\",
-    r"\texttt{sum\_of\_weights\_of\_distinct\_values}\\",
-    r"\texttt{sum\_powers4\_ctr}\\",
-    r"\texttt{sum\_powers5\_ctr}\\",
-    r"\texttt{sum\_powers6\_ctr}\\",
-    r"\texttt{sum\_set}\\",
-    r"\texttt{sum\_squares\_ctr}\\",
-    r"\texttt{symmetric}\\",
-    r"\texttt{symmetric\_alldifferent}\\",
-    r"\texttt{symmetric\_alldifferent\_except\_0}\\",
-    r"\texttt{symmetric\_alldifferent\_loop}\\",
-    r"\texttt{symmetric\_cardinality}\\",
-    r"\texttt{symmetric\_gcc}\\",
-    r"\texttt{temporal\_path}\\",
-    r"\texttt{tour}\\",
-    r"\texttt{track}\\",
-    r"\texttt{tree}\\",
-    r"\texttt{tree\_range}\\",
-    r"\texttt{tree\_resource}\\",
-    r"\texttt{twin}\\",
-    r"\texttt{two\_layer\_edge\_crossing}\\",
-    r"\texttt{two\_orth\_are\_in\_contact}\\",
-    r"\texttt{two\_orth\_column}\\",
-    r"\texttt{two\_orth\_do\_not\_overlap}\\",
-    r"\texttt{two\_orth\_include}\\",
-    r"\texttt{used\_by}\\",
-    r"\texttt{used\_by\_interval}\\",
-    r"\texttt{used\_by\_modulo}\\",
-    r"\texttt{used\_by\_partition}\\",
-    r"\texttt{uses}\\",
-    r"\texttt{valley}\\",
-    r"\texttt{vec\_eq\_tuple}\\",
-    r"\texttt{visible}\\",
-    r"\texttt{weighted\_partial\_alldiff}\\",
-    r"\texttt{xor}\\",
-    r"\texttt{zero\_or\_not\_zero}\\",
-    r"\texttt{zero\_or\_not\_zero\_vectors"
-]
\ No newline at end of file
+from pathlib import Path
+
+from .catalogue import Catalogue
+
+# The Global Constraint Catalogue's constraint names, read on first use
+big_constraints_list = Catalogue(Path(__file__).parent / "data" / "global_constraints.txt")
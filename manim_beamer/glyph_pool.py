@@ -0,0 +1,41 @@
+from manim import *
+
+INTEGER_GLYPHS = ("-", "0", "1", "2", "3", "4", "5", "6", "7", "8", "9")
+
+
+class GlyphPool:
+    # Typesets a small alphabet once, in a single MathTex so every glyph sits
+    # on the same baseline, and builds strings over it by copying outlines.
+    # Labels that change every frame (bounds, counters) then never go back
+    # to LaTeX.
+    #
+    #     pool = GlyphPool(INTEGER_GLYPHS + (r"\leq",), color=BLACK)
+    #     label = pool.integer(-3, suffix=[r"\leq"])
+
+    def __init__(self, glyphs=INTEGER_GLYPHS, spacing=None, kerning=0.02, **kwargs):
+        typeset = MathTex(*glyphs, **kwargs)
+        reference = typeset.get_bottom()[1]
+        self.glyphs = dict(zip(glyphs, typeset))
+        self.offsets = {g: m.get_y() - reference for g, m in self.glyphs.items()}
+        # Extra room either side of a glyph, e.g. around relations
+        self.spacing = {r"\leq": 0.12, r"\geq": 0.12, "=": 0.12}
+        self.spacing.update(spacing or {})
+        self.kerning = kerning
+        self._built = {}
+
+    def text(self, glyphs):
+        glyphs = tuple(glyphs)
+        if glyphs not in self._built:
+            group = VGroup()
+            x = 0
+            for g in glyphs:
+                glyph = self.glyphs[g].copy()
+                x += self.spacing.get(g, 0)
+                glyph.move_to([x + glyph.width / 2, self.offsets[g], 0])
+                x += glyph.width + self.spacing.get(g, 0) + self.kerning
+                group.add(glyph)
+            self._built[glyphs] = group
+        return self._built[glyphs].copy()
+
+    def integer(self, value, prefix=(), suffix=()):
+        return self.text([*prefix, *str(int(value)), *suffix])
@@ -0,0 +1,70 @@
+from .pb_strings import LATEX_BUDGET, PBBitVar, PBConstraint, PBSum
+
+
+class MultiplicationEncoding():
+    # Bit-blasts X * Y = Z over unsigned PBIntVars, as on the ThisPaper slide:
+    #
+    #     sum_i 2^i z_bi - sum_i sum_j 2^(i+j) xy_bij = 0
+    #     xy_bij <=> x_bi + y_bj >= 2
+    #
+    # Each product bit xy_bij is made once per pair of bit variables and
+    # reused by every later multiplication of the same bits, so its two
+    # reification constraints are only emitted the first time. Constraints
+    # are generated lazily as (coeffs, literals, rhs) in normalized form.
+    #
+    #     encoding = MultiplicationEncoding()
+    #     with PBWriter("mult.opb") as opb:
+    #         encoding.write(opb, x, y, z)
+
+    def __init__(self):
+        self.products = {}
+
+    def product(self, a, b):
+        # The product bit of a and b, and whether it was just made
+        key = (a.id, b.id) if a.id < b.id else (b.id, a.id)
+        ab = self.products.get(key)
+        if ab is not None:
+            return ab, False
+        if a._bit < 10 and b._bit < 10:
+            bits = f"{a._bit}{b._bit}"
+        else:
+            bits = f"{a._bit},{b._bit}"
+        ab = PBBitVar(a._label + b._label, bits)
+        self.products[key] = ab
+        return ab, True
+
+    def reification(self, a, b, ab):
+        # ab => a and b:   a + b + 2 ~ab >= 2
+        yield (1, 1, 2), (a.id, b.id, -ab.id), 2
+        # a and b => ab:   ~a + ~b + ab >= 1
+        yield (1, 1, 1), (-a.id, -b.id, ab.id), 1
+
+    def terms(self, x, y, z):
+        total = PBSum()
+        total.add_terms(
+            [1 << i for i in range(z.num_bits)], range(z.base, z.base + z.num_bits)
+        )
+        for i, a in enumerate(x.bit_vars):
+            for j, b in enumerate(y.bit_vars):
+                ab, new = self.product(a, b)
+                if new:
+                    yield from self.reification(a, b, ab)
+                total.add_term(-(1 << (i + j)), ab.id)
+
+        # total = 0, as total >= 0 and -total >= 0
+        for side in (total, -total):
+            coeffs, literals, constant = side.normalized()
+            yield coeffs, literals, -constant
+
+    def constraints(self, x, y, z):
+        for coeffs, literals, rhs in self.terms(x, y, z):
+            pb_sum = PBSum()
+            pb_sum.add_terms(coeffs, literals)
+            yield PBConstraint(pb_sum, rhs)
+
+    def latex(self, x, y, z, budget=LATEX_BUDGET):
+        return [c.latex(budget) for c in self.constraints(x, y, z)]
+
+    def write(self, writer, x, y, z, rule=None):
+        for coeffs, literals, rhs in self.terms(x, y, z):
+            writer.write_terms(coeffs, literals, rhs, rule=rule)
@@ -1,54 +1,455 @@
+import sys
+from array import array
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Sequence
+
+
+class PBVarRegistry():
+    # Every bit variable has a positive integer id, its negation the negative
+    # id. Ids are handed out in blocks, one per PBIntVar (one id per bit) or
+    # standalone PBBitVar, and the registry stores one row per block rather
+    # than one object per bit: the block's first id, its interned label and
+    # the bit number of its first id. Names are built the first time they are
+    # printed and kept.
+
+    def __init__(self):
+        self._bases = array("q")
+        self._labels = []
+        self._first_bits = []
+        self._names = {}
+        self.next_id = 1
+
+    def add(self, label, width=1, bit=0):
+        base = self.next_id
+        self._bases.append(base)
+        self._labels.append(sys.intern(label))
+        self._first_bits.append(bit)
+        self.next_id += width
+        return base
+
+    def __len__(self):
+        return self.next_id - 1
+
+    def _row(self, id):
+        if not 0 < id < self.next_id:
+            raise IndexError(f"no variable with id {id}")
+        return bisect_right(self._bases, id) - 1
+
+    def label(self, id):
+        return self._labels[self._row(id)]
+
+    def bit(self, id):
+        row = self._row(id)
+        first = self._first_bits[row]
+        if isinstance(first, str):
+            return first
+        return first + id - self._bases[row]
+
+    def block(self, id):
+        # (label, first bit, first id, end id) of the block holding id
+        row = self._row(id)
+        end = self._bases[row + 1] if row + 1 < len(self._bases) else self.next_id
+        return self._labels[row], self._first_bits[row], self._bases[row], end
+
+    def name(self, id):
+        name = self._names.get(id)
+        if name is None:
+            name = f"{self.label(id)}_{{b{self.bit(id)}}}"
+            self._names[id] = name
+        return name
+
+
+registry = PBVarRegistry()
+
+
+def _literal_string(literal):
+    if literal < 0:
+        return r"\bar{" + registry.name(-literal) + "}"
+    return registry.name(literal)
+
+
+# Sums rendered with latex() show at most LATEX_BUDGET items; runs of at least
+# MIN_GROUP consecutive bits of one integer variable with coefficients
+# c 2^i become a single \sum item
+LATEX_BUDGET = 12
+MIN_GROUP = 3
+
+
+def _latex_items(coeffs, literals):
+    # Yields (coeff, literal) for single terms and (unit, first, last) for
+    # runs of bits first..last with coefficient unit * 2^bit, in one pass
+    run = []
+    unit = run_base = None
+
+    def flush():
+        if len(run) >= MIN_GROUP:
+            yield unit, run[0][1], run[-1][1]
+        else:
+            yield from run
+
+    for coeff, literal in zip(coeffs, literals):
+        var = abs(literal)
+        label, first_bit, base, end = registry.block(var)
+        bit = first_bit + var - base if isinstance(first_bit, int) else None
+        if run and bit is not None:
+            previous = abs(run[-1][1])
+            # Consecutive ids in another block are another variable's bits
+            if (
+                var == previous + 1
+                and base == run_base
+                and (literal < 0) == (run[-1][1] < 0)
+                and coeff == unit << bit
+            ):
+                run.append((coeff, literal))
+                continue
+        yield from flush()
+        run = []
+        if bit is not None and coeff == (coeff >> bit) << bit:
+            unit, run_base = coeff >> bit, base
+            run = [(coeff, literal)]
+        else:
+            yield coeff, literal
+    yield from flush()
+
+
+def _latex_coeff(coeff):
+    # Large powers of two as 2^k rather than forty-digit numbers
+    coeff = abs(coeff)
+    if coeff == 1:
+        return ""
+    if coeff > 1024 and coeff & (coeff - 1) == 0:
+        return "2^{%d} " % (coeff.bit_length() - 1)
+    return str(coeff) + " "
+
+
+def _latex_item(item):
+    # (sign, LaTeX for the magnitude)
+    if len(item) == 2:
+        coeff, literal = item
+        return coeff < 0, _latex_coeff(coeff) + _literal_string(literal)
+
+    unit, first, last = item
+    label, first_bit, base, end = registry.block(abs(first))
+    lo, hi = first_bit + abs(first) - base, first_bit + abs(last) - base
+    if abs(first) == base and abs(last) == end - 1 and lo == 0:
+        limits = "_i"
+    else:
+        limits = "_{i=%d}^{%d}" % (lo, hi)
+    bit = label + "_{bi}"
+    if first < 0:
+        bit = r"\bar{" + bit + "}"
+    scale = "" if abs(unit) == 1 else str(abs(unit)) + r"\, "
+    return unit < 0, r"\sum" + limits + " 2^i " + scale + bit
+
+
+def render_latex(coeffs, literals, constant=0, budget=LATEX_BUDGET):
+    # A sum as LaTeX. With more than budget items, the first and last few are
+    # kept around a \cdots; only those are ever formatted.
+    head_size = budget if budget is None else (budget + 1) // 2
+    head, tail, total = [], deque(maxlen=0 if budget is None else budget // 2), 0
+    for item in _latex_items(coeffs, literals):
+        total += 1
+        if head_size is None or len(head) < head_size:
+            head.append(item)
+        else:
+            tail.append(item)
+
+    parts = [_latex_item(item) for item in head]
+    if budget is not None and total > budget:
+        parts.append((False, r"\cdots"))
+    parts += [_latex_item(item) for item in tail]
+    if constant:
+        parts.append((constant < 0, str(abs(constant))))
+    if not parts:
+        return "0"
+
+    negative, first = parts[0]
+    latex = ["-" + first if negative else first]
+    for negative, part in parts[1:]:
+        latex.append((" - " if negative else " + ") + part)
+    return "".join(latex)
+
+
+def _literal(var):
+    if isinstance(var, PBNegation):
+        return -var.var.id
+    return var.id
+
+
 class PBConstraint():
     def __init__(self, pb_sum, rhs):
         self._pb_sum = pb_sum
         self._rhs = rhs
-    
+
+    def normalized(self):
+        # (coeffs, literals, rhs) with every coefficient positive and the sum's
+        # constant moved to the right-hand side
+        coeffs, literals, constant = self._pb_sum.normalized()
+        return coeffs, literals, self._rhs - constant
+
     def __str__(self):
-        return str(self._pb_sum) + " \geq " + str(self._rhs)
+        coeffs, literals, rhs = self.normalized()
+        terms = " + ".join(str(c) + " " + _literal_string(l) for c, l in zip(coeffs, literals))
+        return (terms or "0") + r" \geq " + str(rhs)
+
+    def latex(self, budget=LATEX_BUDGET):
+        coeffs, literals, rhs = self.normalized()
+        return render_latex(coeffs, literals, budget=budget) + r" \geq " + str(rhs)
+
 
 class PBSum():
-    def __init__(self, terms = []):
-        self._terms = terms
-    
-    def __str__(self):
-        return " + ".join([str(t) for t in self._terms])
-    
-    def __add__(self, term):
-        new_terms = self._terms + [term]
-        return PBSum(terms = new_terms)
-    
+    # Coefficients and literal ids in two growable arrays, so adding a term is
+    # an append rather than a copy of the whole sum. Coefficients move from a
+    # machine-integer array to a list of Python ints if one overflows. Repeated
+    # literals are merged, and x and ~x folded together, when the sum is read.
+    # A copy (and so the result of +) shares the arrays and owns their first
+    # _size entries; whichever sum appends first keeps them, the others copy
+    # their prefix on their next append, so a + b + c + ... stays linear.
+    #
+    #     s = PBSum()
+    #     for i in range(n):
+    #         s += (2**i) * x.bit_vars[i]
+
+    def __init__(self, terms=()):
+        self._coeffs = array("q")
+        self._literals = array("q")
+        self._size = 0
+        self._constant = 0
+        self._compact = True
+        for term in terms:
+            self += term
+
+    def copy(self):
+        result = PBSum()
+        result._coeffs = self._coeffs
+        result._literals = self._literals
+        result._size = self._size
+        result._constant = self._constant
+        result._compact = self._compact
+        return result
+
+    def _own(self):
+        # Drops entries appended by another sum sharing the arrays
+        if len(self._literals) != self._size:
+            self._coeffs = self._coeffs[: self._size]
+            self._literals = self._literals[: self._size]
+
+    def add_term(self, coeff, literal):
+        self._own()
+        try:
+            self._coeffs.append(coeff)
+        except OverflowError:
+            self._coeffs = list(self._coeffs)
+            self._coeffs.append(coeff)
+        self._literals.append(literal)
+        self._size += 1
+        self._compact = False
+
+    def add_terms(self, coeffs, literals):
+        for coeff, literal in zip(coeffs, literals):
+            self.add_term(coeff, literal)
+
+    def __iadd__(self, other):
+        if isinstance(other, PBSum):
+            # Sliced first, as other may be self (s += s)
+            self.add_terms(other._coeffs[: other._size], other._literals[: other._size])
+            self._constant += other._constant
+        elif isinstance(other, PBTerm):
+            other.add_to(self)
+        elif isinstance(other, int):
+            self._constant += other
+        else:
+            (1 * other).add_to(self)
+        return self
+
+    def __add__(self, other):
+        return self.copy().__iadd__(other)
+
+    def __neg__(self):
+        result = PBSum()
+        result.add_terms(
+            [-c for c in self._coeffs[: self._size]], self._literals[: self._size]
+        )
+        result._constant = -self._constant
+        return result
+
+    def __radd__(self, other):
+        # Lets sum() start from 0
+        return self.copy().__iadd__(other)
+
     def __ge__(self, num):
         return PBConstraint(self, num)
-    
+
+    def _merge(self):
+        self._own()
+        if self._compact:
+            return
+        merged = {}
+        for coeff, literal in zip(self._coeffs, self._literals):
+            merged[literal] = merged.get(literal, 0) + coeff
+        # c ~x = c - c x
+        for literal in [l for l in merged if l < 0 and -l in merged]:
+            coeff = merged.pop(literal)
+            merged[-literal] -= coeff
+            self._constant += coeff
+        self._coeffs = array("q")
+        self._literals = array("q")
+        self._size = 0
+        for literal, coeff in merged.items():
+            if coeff != 0:
+                self.add_term(coeff, literal)
+        self._compact = True
+
+    def terms(self):
+        self._merge()
+        return list(self._coeffs), list(self._literals)
+
+    def normalized(self):
+        # Negative coefficients turned onto negated literals: c x = c + |c| ~x
+        self._merge()
+        coeffs, literals, constant = [], [], self._constant
+        for coeff, literal in zip(self._coeffs, self._literals):
+            if coeff < 0:
+                constant += coeff
+                coeff, literal = -coeff, -literal
+            coeffs.append(coeff)
+            literals.append(literal)
+        return coeffs, literals, constant
+
+    def __len__(self):
+        self._merge()
+        return len(self._literals)
+
+    def latex(self, budget=LATEX_BUDGET):
+        coeffs, literals = self.terms()
+        return render_latex(coeffs, literals, self._constant, budget)
+
+    def __str__(self):
+        coeffs, literals = self.terms()
+        terms = [str(c) + " " + _literal_string(l) for c, l in zip(coeffs, literals)]
+        if self._constant:
+            terms.append(str(self._constant))
+        return " + ".join(terms)
+
+
 class PBTerm():
     def __init__(self, coeff, var):
         self._var = var
         self._coeff = coeff
-    
-    def __str__(self):
+
+    def add_to(self, pb_sum):
         if isinstance(self._var, PBIntVar):
-            return " + ".join([str((2**i) * self._coeff) + ' ' + str(self._var.bit_vars[i]) for i in range(self._var.num_bits)])
+            # Bit i of an integer variable carries coeff * 2^i
+            pb_sum.add_terms(
+                [self._coeff << i for i in range(self._var.num_bits)],
+                range(self._var.base, self._var.base + self._var.num_bits),
+            )
+        else:
+            pb_sum.add_term(self._coeff, _literal(self._var))
+
+    def __add__(self, other):
+        return PBSum([self, other])
+
+    def __radd__(self, other):
+        # Lets sum() start from 0
+        return PBSum([other, self])
+
+    def __ge__(self, num):
+        return PBConstraint(PBSum([self]), num)
+
+    def latex(self, budget=LATEX_BUDGET):
+        return PBSum([self]).latex(budget)
+
+    def __str__(self):
+        return str(PBSum([self]))
+
 
-        
-        return str(self._coeff) + ' ' + str(self._var)
-            
 class PBIntVar():
+    __slots__ = ("_id", "_label", "num_bits", "base")
+
     def __init__(self, label, num_bits, id=None):
         self._id = id if id is not None else ''
-        self._label = label
+        self._label = sys.intern(label)
         self.num_bits = num_bits
-        self.bit_vars = [PBBitVar(label, i) for i in range(self.num_bits)]
-    
+        self.base = registry.add(label, num_bits)
+
+    @property
+    def bit_vars(self):
+        return PBBitVars(self)
+
     def __rmul__(self, coeff):
         return PBTerm(coeff, self)
 
+
+class PBBitVars(Sequence):
+    # An integer variable's bits, made as they are indexed
+    __slots__ = ("var",)
+
+    def __init__(self, var):
+        self.var = var
+
+    def __len__(self):
+        return self.var.num_bits
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("bit index out of range")
+        return PBBitVar.from_id(self.var.base + i)
+
+
 class PBBitVar():
+    # A flyweight: just the id, with label and bit looked up in the registry
+    __slots__ = ("id",)
+
     def __init__(self, label, bit):
-        self._label = label
-        self._bit = bit
-    
+        self.id = registry.add(label, bit=bit)
+
+    @classmethod
+    def from_id(cls, id):
+        var = cls.__new__(cls)
+        var.id = id
+        return var
+
+    @property
+    def _label(self):
+        return registry.label(self.id)
+
+    @property
+    def _bit(self):
+        return registry.bit(self.id)
+
+    def __eq__(self, other):
+        return isinstance(other, PBBitVar) and other.id == self.id
+
+    def __hash__(self):
+        return hash(self.id)
+
     def __str__(self):
-        return self._label + "_{b" + str(self._bit) + "}"
-    
+        return registry.name(self.id)
+
+    def __invert__(self):
+        return PBNegation(self)
+
+    def __rmul__(self, coeff):
+        return PBTerm(coeff, self)
+
+
+class PBNegation():
+    __slots__ = ("var",)
+
+    def __init__(self, var):
+        self.var = var
+
+    def __str__(self):
+        return r"\bar{" + str(self.var) + "}"
+
+    def __invert__(self):
+        return self.var
+
     def __rmul__(self, coeff):
         return PBTerm(coeff, self)
@@ -0,0 +1,144 @@
+from .pb_strings import PBConstraint
+
+OPB_HEADER_WIDTH = 64
+VERIPB_HEADER = b"pseudo-Boolean proof version 2.0\n"
+
+
+class PBWriter():
+    # Streams pb_strings constraints to an OPB instance or a VeriPB proof,
+    # with variable x<id> for bit variable id. Lines are formatted straight
+    # into a bytearray that goes to the file in buffer_size chunks.
+    #
+    #     with PBWriter("mult.opb") as opb:
+    #         opb.write(pb_sum >= 0)
+    #
+    #     with PBWriter("mult.pbp", format="veripb") as proof:
+    #         proof.write(pb_sum >= 0, rule="rup")
+    #
+    # For OPB the "* #variable= ... #constraint= ..." header is reserved at the
+    # start and filled in on close. A file that can't seek (a pipe, a socket)
+    # needs num_variables and num_constraints up front instead, and close()
+    # raises if what was written doesn't match them.
+
+    def __init__(
+        self,
+        file,
+        format="opb",
+        buffer_size=1 << 20,
+        num_variables=None,
+        num_constraints=None,
+    ):
+        if format not in ("opb", "veripb"):
+            raise ValueError(f"unknown format {format!r}, expected 'opb' or 'veripb'")
+        declared = (num_variables, num_constraints)
+        if None not in declared:
+            self._declared = declared
+        elif declared == (None, None):
+            self._declared = None
+        else:
+            raise ValueError("give both num_variables and num_constraints, or neither")
+        self.format = format
+        self.buffer_size = buffer_size
+        if hasattr(file, "write"):
+            self.file = file
+            self._owns_file = False
+        else:
+            self.file = open(file, "wb", buffering=0)
+            self._owns_file = True
+        self._buffer = bytearray()
+        self._templates = {}
+        self.num_variables = 0
+        self.num_constraints = 0
+
+        self._header_at = None
+        if format == "opb":
+            if self._declared is not None:
+                self._buffer += self._opb_header(*self._declared)
+            elif self.file.seekable():
+                self._header_at = self.file.tell()
+                self._buffer += self._opb_header(0, 0)
+            else:
+                if self._owns_file:
+                    self.file.close()
+                raise ValueError(
+                    "OPB output that can't seek needs num_variables and "
+                    "num_constraints up front for its header"
+                )
+        else:
+            self._buffer += VERIPB_HEADER
+
+    def _opb_header(self, num_variables, num_constraints):
+        header = b"* #variable= %d #constraint= %d" % (num_variables, num_constraints)
+        return header.ljust(OPB_HEADER_WIDTH) + b"\n"
+
+    def _template(self, n):
+        # One %-format per term count, so a whole line is a single format call
+        template = self._templates.get(n)
+        if template is None:
+            template = b"%+d %sx%d " * n + b">= %d ;\n"
+            self._templates[n] = template
+        return template
+
+    def write_terms(self, coeffs, literals, rhs, rule=None):
+        # One normalized constraint, sum(coeffs[i] * literals[i]) >= rhs, with
+        # negative literal ids for negations
+        buffer = self._buffer
+        if self.format == "veripb":
+            buffer += (rule or "rup").encode() + b" "
+        args = []
+        for coeff, literal in zip(coeffs, literals):
+            if literal < 0:
+                args += (coeff, b"~", -literal)
+            else:
+                args += (coeff, b"", literal)
+        args.append(rhs)
+        self.num_variables = max(self.num_variables, max(map(abs, literals), default=0))
+        buffer += self._template(len(literals)) % tuple(args)
+        self.num_constraints += 1
+        if len(buffer) >= self.buffer_size:
+            self.flush()
+
+    def write(self, constraint, rule=None):
+        if not isinstance(constraint, PBConstraint):
+            raise TypeError(f"expected a PBConstraint, got {type(constraint).__name__}")
+        self.write_terms(*constraint.normalized(), rule=rule)
+
+    def write_all(self, constraints, rule=None):
+        for constraint in constraints:
+            self.write(constraint, rule)
+
+    def comment(self, text):
+        for line in str(text).splitlines() or [""]:
+            self._buffer += b"* " + line.encode() + b"\n"
+
+    def flush(self):
+        if self._buffer:
+            self.file.write(self._buffer)
+            self._buffer = bytearray()
+
+    def close(self):
+        self.flush()
+        if self._header_at is not None:
+            end = self.file.tell()
+            self.file.seek(self._header_at)
+            self.file.write(self._opb_header(self.num_variables, self.num_constraints))
+            self.file.seek(end)
+        if self._owns_file:
+            self.file.close()
+        else:
+            self.file.flush()
+
+        if self.format == "opb" and self._declared is not None:
+            num_variables, num_constraints = self._declared
+            if self.num_variables > num_variables or self.num_constraints != num_constraints:
+                raise ValueError(
+                    f"OPB header declares {num_variables} variables and "
+                    f"{num_constraints} constraints, but {self.num_variables} "
+                    f"variables and {self.num_constraints} constraints were written"
+                )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
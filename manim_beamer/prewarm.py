@@ -0,0 +1,303 @@
+import argparse
+import ast
+import builtins
+import inspect
+import itertools
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+
+from manim import *
+
+from . import build
+from .fingerprint import _imported_modules, _is_local
+from .tex_batch import _DeferredTex, prepare_tex
+from .tex_cache import DEFAULT_TEX_CACHE, DEFAULT_TEX_CACHE_BYTES
+from .text_cache import DEFAULT_TEXT_CACHE
+from .virtual_scroll import VirtualScrollList
+
+TYPESET_CLASSES = (SingleStringMathTex, Text, MarkupText, Paragraph)
+TYPESET_FUNCTIONS = ("cached_text", "batch_mathtex")
+
+# Upper bound on the calls a single call site may expand to, through the
+# comprehensions around it
+MAX_EXPANSION = 100_000
+
+
+def _names(node):
+    return {n.id for n in ast.walk(node) if isinstance(n, ast.Name)}
+
+
+def _target_names(target):
+    return {n.id for n in ast.walk(target) if isinstance(n, ast.Name)}
+
+
+class LiteralCallFinder(ast.NodeVisitor):
+    # Finds calls that typeset something and whose arguments can be worked
+    # out from module-level names alone, possibly via the comprehensions
+    # they sit in (e.g. [MathTex(b) for b in big_constraints_list])
+
+    def __init__(self, module, root):
+        self.module = module
+        self.namespace = vars(module)
+        self.root = root
+        self.function_locals = []
+        self.generators = []
+        self.calls = []
+        # Typesetting calls whose arguments depend on local state
+        self.skipped = 0
+
+    def _typesets(self, name):
+        obj = self.namespace.get(name)
+        if name in TYPESET_FUNCTIONS:
+            return obj is not None
+        if not inspect.isclass(obj) or not issubclass(obj, Mobject):
+            return False
+        if issubclass(obj, TYPESET_CLASSES):
+            return True
+        # manim_beamer components and other talk-local mobjects
+        source = sys.modules.get(obj.__module__)
+        return _is_local(getattr(source, "__file__", None) or "/", self.root)
+
+    def _is_global(self, name, bound):
+        if name in bound:
+            return True
+        if any(name in names for names in self.function_locals):
+            return False
+        return name in self.namespace or hasattr(builtins, name)
+
+    def _evaluable(self, call):
+        bound = set()
+        for generator in self.generators:
+            needed = _names(generator.iter).union(*map(_names, generator.ifs))
+            needed -= _target_names(generator.target)
+            if not all(self._is_global(n, bound) for n in needed):
+                return False
+            bound |= _target_names(generator.target)
+
+        arguments = [*call.args, *(k.value for k in call.keywords)]
+        needed = set().union(*map(_names, arguments)) if arguments else set()
+        return all(self._is_global(n, bound) for n in needed)
+
+    def visit_FunctionDef(self, node):
+        args = node.args
+        names = {a.arg for a in args.posonlyargs + args.args + args.kwonlyargs}
+        names |= {a.arg for a in (args.vararg, args.kwarg) if a is not None}
+        names |= {
+            n.id
+            for n in ast.walk(node)
+            if isinstance(n, ast.Name) and isinstance(n.ctx, ast.Store)
+        }
+        self.function_locals.append(names)
+        self.generic_visit(node)
+        self.function_locals.pop()
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+    visit_Lambda = visit_FunctionDef
+
+    def _visit_comprehension(self, node):
+        self.generators.extend(node.generators)
+        self.generic_visit(node)
+        del self.generators[len(self.generators) - len(node.generators) :]
+
+    visit_ListComp = _visit_comprehension
+    visit_SetComp = _visit_comprehension
+    visit_DictComp = _visit_comprehension
+    visit_GeneratorExp = _visit_comprehension
+
+    def visit_Call(self, node):
+        if isinstance(node.func, ast.Name) and self._typesets(node.func.id):
+            if self._evaluable(node):
+                self.calls.append((node, list(self.generators)))
+            else:
+                self.skipped += 1
+        self.generic_visit(node)
+
+
+def _evaluate(node, namespace, bindings):
+    expression = ast.fix_missing_locations(ast.Expression(body=node))
+    return eval(compile(expression, "<prewarm>", "eval"), namespace, bindings)
+
+
+def _assign(target, value, bindings):
+    if isinstance(target, ast.Name):
+        bindings[target.id] = value
+    else:
+        for t, v in zip(target.elts, value):
+            _assign(t, v, bindings)
+
+
+def _expand(generators, namespace, bindings=None):
+    bindings = bindings or {}
+    if not generators:
+        yield bindings
+        return
+    generator, rest = generators[0], generators[1:]
+    for item in _evaluate(generator.iter, namespace, bindings):
+        inner = dict(bindings)
+        _assign(generator.target, item, inner)
+        if all(_evaluate(c, namespace, inner) for c in generator.ifs):
+            yield from _expand(rest, namespace, inner)
+
+
+def _scroll_entry_jobs(call, namespace, bindings):
+    # A VirtualScrollList only builds the rows in view, so building it
+    # typesets almost nothing; instead, one job per entry, made the way the
+    # list makes it: mobject_class(entry, **kwargs)
+    signature = inspect.signature(namespace[call.func.id])
+    arguments = signature.bind(
+        *call.args, **{k.arg: k.value for k in call.keywords if k.arg}
+    ).arguments
+    entries = _evaluate(arguments["entries"], namespace, bindings)
+    if "mobject_class" in arguments:
+        mobject_class = _evaluate(arguments["mobject_class"], namespace, bindings)
+    else:
+        mobject_class = signature.parameters["mobject_class"].default
+
+    kwargs = [k for k in call.keywords if k.arg is None]
+    for parameter in signature.parameters.values():
+        if parameter.kind == inspect.Parameter.VAR_KEYWORD:
+            extra = arguments.get(parameter.name, {})
+            kwargs += [ast.keyword(arg=k, value=v) for k, v in extra.items()]
+    source = ast.unparse(
+        ast.Call(func=ast.Name("_mobject_class"), args=[ast.Name("_entry")], keywords=kwargs)
+    )
+    for entry in itertools.islice(entries, MAX_EXPANSION):
+        yield source, {**bindings, "_mobject_class": mobject_class, "_entry": entry}
+
+
+def find_prewarm_jobs(talk):
+    # (module name, call source, comprehension bindings) for every literal
+    # typesetting call in the talk and the local modules it uses, and the
+    # number of typesetting calls skipped as not literal
+    root = Path(talk.__file__).resolve().parent
+    modules = [talk.__name__]
+    todo = list(_imported_modules(talk))
+    while todo:
+        name = todo.pop()
+        module = sys.modules.get(name)
+        if name in modules or module is None:
+            continue
+        if _is_local(getattr(module, "__file__", None) or "/", root):
+            modules.append(name)
+            todo.extend(_imported_modules(module))
+
+    jobs = set()
+    skipped = 0
+    for name in modules:
+        module = sys.modules[name]
+        finder = LiteralCallFinder(module, root)
+        finder.visit(ast.parse(inspect.getsource(module)))
+        skipped += finder.skipped
+
+        for call, generators in finder.calls:
+            source = ast.unparse(call)
+            used = _names(call) | {"_mobject_class", "_entry"}
+            typesetter = vars(module)[call.func.id]
+            scroll = inspect.isclass(typesetter) and issubclass(
+                typesetter, VirtualScrollList
+            )
+            try:
+                for bindings in itertools.islice(
+                    _expand(generators, vars(module)), MAX_EXPANSION
+                ):
+                    if scroll:
+                        expanded = _scroll_entry_jobs(call, vars(module), bindings)
+                    else:
+                        expanded = [(source, bindings)]
+                    for job_source, job_bindings in expanded:
+                        job_bindings = tuple(
+                            sorted((k, v) for k, v in job_bindings.items() if k in used)
+                        )
+                        jobs.add((name, job_source, job_bindings))
+            except Exception as e:
+                skipped += 1
+                print(f"Skipping {source} in {name}: {e!r}", file=sys.stderr)
+
+    return sorted(jobs, key=repr), skipped
+
+
+def _run_job(module_name, source, bindings):
+    try:
+        return eval(source, vars(sys.modules[module_name]), dict(bindings))
+    except _DeferredTex:
+        raise
+    except Exception:
+        return None
+
+
+def _prewarm_chunk(jobs):
+    with tempconfig(build._config):
+        results = prepare_tex([partial(_run_job, *job) for job in jobs])
+    return sum(r is None for r in results)
+
+
+def prewarm(talk_path, build_dir, jobs, tex_cache, text_cache):
+    talk = build.load_talk(talk_path)
+    work, skipped = find_prewarm_jobs(talk)
+    if not work:
+        return 0, 0, skipped
+
+    # One chunk per worker, interleaved so long lists are spread evenly;
+    # each chunk then typesets its share of the TeX in a single LaTeX run
+    jobs = min(jobs, len(work))
+    chunks = [work[i::jobs] for i in range(jobs)]
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=context,
+        initializer=build._init_worker,
+        initargs=(
+            str(talk_path),
+            str(build_dir),
+            build.render_config("low_quality"),
+            tex_cache,
+            text_cache,
+            build.worker_slots(context, jobs),
+        ),
+    ) as pool:
+        failed = sum(pool.map(_prewarm_chunk, chunks))
+    return len(work), failed, skipped
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m manim_beamer.prewarm",
+        description="Typeset every literal Tex and text in a talk into the "
+        "shared caches ahead of rendering.",
+    )
+    parser.add_argument("talk", help="talk module, e.g. aaai.py")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=os.cpu_count(), help="typesetting workers"
+    )
+    parser.add_argument("--tex-cache", default=DEFAULT_TEX_CACHE)
+    parser.add_argument(
+        "--tex-cache-mb", type=int, default=DEFAULT_TEX_CACHE_BYTES // 2**20
+    )
+    parser.add_argument("--text-cache", default=DEFAULT_TEXT_CACHE)
+    parser.add_argument("--build-dir", default="build")
+    args = parser.parse_args(argv)
+
+    talk_path = Path(args.talk).resolve()
+    start = time.perf_counter()
+    count, failed, skipped = prewarm(
+        talk_path,
+        talk_path.parent / args.build_dir,
+        args.jobs,
+        (str(args.tex_cache), args.tex_cache_mb * 2**20),
+        str(args.text_cache),
+    )
+    print(
+        f"Prewarmed {count - failed} typesetting calls in "
+        f"{time.perf_counter() - start:.1f}s ({failed} could not be evaluated, "
+        f"{skipped} call sites skipped as not literal)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+import csv
+import json
+import os
+import time
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+
+from manim import *
+from manim.mobject.text import tex_mobject
+
+from . import tex_batch, tex_cache
+
+PHASES = ("construction", "typesetting", "rendering", "encoding", "other")
+
+# Module attributes every Tex and Text typesets through; timed while a scene
+# is being profiled
+TYPESETTING_HOOKS = (
+    (tex_mobject, "tex_to_svg_file"),
+    (tex_batch, "typeset_batch"),
+    (Text, "_text2svg"),
+    (MarkupText, "_text2svg"),
+)
+
+
+class SceneProfiler:
+    # Splits a scene's wall time into PHASES. Time is exclusive: a MathTex
+    # built inside construct counts as typesetting, not construction, and
+    # writing frames inside play counts as encoding, not rendering.
+
+    def __init__(self, scene):
+        self.scene = scene
+        self.seconds = dict.fromkeys(PHASES, 0.0)
+        self.typeset_calls = 0
+        self.latex_runs = 0
+        self.frames = 0
+        self.slide = 0
+        self.animations = []
+        self._stack = []
+        self._restore = []
+
+    def _switch(self):
+        now = time.perf_counter()
+        if self._stack:
+            self.seconds[self._stack[-1][0]] += now - self._stack[-1][1]
+        return now
+
+    @contextmanager
+    def phase(self, name):
+        now = self._switch()
+        self._stack.append([name, now])
+        try:
+            yield
+        finally:
+            now = self._switch()
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1][1] = now
+
+    def timed(self, name, function, counter=None):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if counter is not None:
+                setattr(self, counter, getattr(self, counter) + 1)
+            with self.phase(name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    def _patch(self, owner, attribute, phase, counter=None):
+        original = getattr(owner, attribute)
+        self._restore.append((owner, attribute, original, attribute in vars(owner)))
+        setattr(owner, attribute, self.timed(phase, original, counter))
+
+    def _latex_runs(self):
+        cache = tex_cache.active_cache
+        return cache.latex_runs if cache is not None else 0
+
+    def __enter__(self):
+        self._latex_runs_at_start = self._latex_runs()
+        self._stack = [["other", time.perf_counter()]]
+        self._start = self._stack[0][1]
+
+        for owner, attribute in TYPESETTING_HOOKS:
+            self._patch(owner, attribute, "typesetting", "typeset_calls")
+
+        self._patch(self.scene, "construct", "construction")
+        file_writer = self.scene.renderer.file_writer
+        self._patch(file_writer, "write_frame", "encoding", "frames")
+        for attribute in ("end_animation", "finish"):
+            self._patch(file_writer, attribute, "encoding")
+        return self
+
+    def __exit__(self, *exc_info):
+        self._switch()
+        self._stack = []
+        self.total = time.perf_counter() - self._start
+        self.latex_runs = self._latex_runs() - self._latex_runs_at_start
+
+        for owner, attribute, original, was_own in reversed(self._restore):
+            if was_own:
+                setattr(owner, attribute, original)
+            else:
+                delattr(owner, attribute)
+        self._restore = []
+
+    @contextmanager
+    def animation(self, kind, animations=()):
+        # wait() and next_slide() go through play() themselves; only the
+        # outermost call is recorded
+        if any(name == "rendering" for name, _ in self._stack):
+            yield
+            return
+
+        start, frames = time.perf_counter(), self.frames
+        with self.phase("rendering"):
+            yield
+        self.animations.append(
+            {
+                "slide": self.slide,
+                "kind": kind,
+                "animations": [type(a).__name__ for a in animations],
+                "seconds": time.perf_counter() - start,
+                "frames": self.frames - frames,
+                "mobjects": len(self.scene.mobjects),
+                "family_mobjects": len(self.scene.get_mobject_family_members()),
+            }
+        )
+
+    def next_slide(self):
+        self.slide += 1
+
+    def report(self):
+        return {
+            "scene": type(self.scene).__name__,
+            "total": self.total,
+            **self.seconds,
+            "typeset_calls": self.typeset_calls,
+            "latex_runs": self.latex_runs,
+            "frames": self.frames,
+            "slides": self.slide + 1,
+            "peak_family_mobjects": max(
+                (a["family_mobjects"] for a in self.animations), default=0
+            ),
+            "animations": self.animations,
+        }
+
+    def write(self, directory):
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{type(self.scene).__name__}.json"
+        path.write_text(json.dumps(self.report(), indent=2))
+        return path
+
+
+def profile_directory(scene):
+    return getattr(scene, "profile_dir", None) or os.environ.get(
+        "MANIM_BEAMER_PROFILE"
+    )
+
+
+def write_build_report(directory, scenes):
+    # Gathers the per-scene JSON written by each worker into profile.json, a
+    # per-scene profile.csv and a per-animation animations.csv
+    directory = Path(directory)
+    reports = []
+    for scene in scenes:
+        path = directory / f"{scene}.json"
+        if path.exists():
+            reports.append(json.loads(path.read_text()))
+    if not reports:
+        return None
+
+    (directory / "profile.json").write_text(json.dumps(reports, indent=2))
+
+    columns = [
+        "scene",
+        "total",
+        *PHASES,
+        "typeset_calls",
+        "latex_runs",
+        "frames",
+        "slides",
+        "peak_family_mobjects",
+    ]
+    with open(directory / "profile.csv", "w", newline="") as f:
+        writer = csv.DictWriter(f, columns, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(reports)
+
+    with open(directory / "animations.csv", "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(
+            [
+                "scene",
+                "slide",
+                "kind",
+                "animations",
+                "seconds",
+                "frames",
+                "mobjects",
+                "family_mobjects",
+            ]
+        )
+        for report in reports:
+            for a in report["animations"]:
+                writer.writerow(
+                    [
+                        report["scene"],
+                        a["slide"],
+                        a["kind"],
+                        " ".join(a["animations"]),
+                        f"{a['seconds']:.4f}",
+                        a["frames"],
+                        a["mobjects"],
+                        a["family_mobjects"],
+                    ]
+                )
+    return reports
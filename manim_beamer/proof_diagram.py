@@ -2,6 +2,7 @@ from manim import *
 from manim_slides import Slide
 from .constants import *
 from .proof_scroll import *
+from .text_cache import cached_text
 
 
 arrow_style = {"stroke_width": 6, "stroke_color": BLUE}
@@ -31,7 +32,7 @@ class ProofDiagramBox(Group):
             **kwargs
         )
         self.text = (
-            Paragraph(label, alignment="center", **TALK_BODY_TEXT)
+            cached_text(label, Paragraph, alignment="center", **TALK_BODY_TEXT)
             .align_to(self.rect, UP)
             .shift(DOWN * text_buff)
             .scale(text_scale)
@@ -104,7 +105,7 @@ class ProofScroll(Group):
         self.scroll = Scroll(width=width, height=height, tube_height=0.2)
 
         self.header = (
-            Text("Proof", **TALK_BODY_TEXT)
+            cached_text("Proof", **TALK_BODY_TEXT)
             .scale(0.8)
             .next_to(self.scroll.get_body_top(), DOWN, buff=0.2)
         )
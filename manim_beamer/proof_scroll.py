@@ -2,6 +2,7 @@ from manim import *
 from manim_slides import Slide
 
 from .constants import *
+from .tex_batch import batch_mathtex
 
 
 class Tube(VGroup):
@@ -230,7 +231,7 @@ class ScrollWithTex(Group):
     def __init__(self, tex_strings, vbuff=0.4, buff=0.3, **kwargs):
         super().__init__()
         self.scroll = Scroll(**kwargs)
-        self.content = Group(*[MathTex(s, color=WHITE) for s in tex_strings]).arrange(
+        self.content = Group(*batch_mathtex(tex_strings, color=WHITE)).arrange(
             DOWN, buff=vbuff
         )
 
@@ -252,10 +253,9 @@ class ScrollWithTex(Group):
         self.add(self.scroll, self.content)
 
     def add_content(self, tex_strings, buff=0.25):
-        for t in tex_strings:
+        for t in batch_mathtex(tex_strings, color=WHITE):
             self.content.add(
-                MathTex(t, color=WHITE)
-                .scale_to_fit_height(self.content[0].height)
+                t.scale_to_fit_height(self.content[0].height)
                 .next_to(self.content[-1], DOWN, buff=buff)
                 .align_to(self.content[0], LEFT)
             )
@@ -0,0 +1,136 @@
+import math
+
+from manim import *
+
+from .virtual_scroll import VirtualScrollList
+
+# Rows per rasterization pass; Cairo surfaces top out at 32767 pixels a side
+MAX_TILE_PIXELS = 8192
+
+
+class RasterScroll(Group):
+    # Scrolls a static mobject by rasterizing it once, at output resolution,
+    # into a tall bitmap and then showing only the slice of it that is in the
+    # viewport. Frames cost one viewport-sized image however many glyphs the
+    # content has. Offsets snap to whole output pixels, which keeps the
+    # bitmap's pixels on the frame's pixels and the result identical to
+    # drawing the vectors.
+    #
+    #     big_list = RasterScroll(VirtualScrollList(big_constraints_list))
+    #     self.play(big_list.scroll_to_end(bottom=0), run_time=25)
+
+    def __init__(self, mobject, viewport_top=None, viewport_bottom=None, z_index=0):
+        super().__init__(z_index=z_index)
+        self.viewport_top = (
+            config["frame_height"] / 2 if viewport_top is None else viewport_top
+        )
+        self.viewport_bottom = (
+            -config["frame_height"] / 2 if viewport_bottom is None else viewport_bottom
+        )
+        self.unit = config["frame_height"] / config["pixel_height"]
+
+        top, bottom, left, right = self._pixel_aligned_extent(mobject)
+        self.texture, left = self._rasterize(mobject, top, bottom, left, right)
+        self.total_height = self.texture.shape[0] * self.unit
+
+        self.offset = ValueTracker(0)
+        self.anchor = VectorizedPoint([left, top, 0])
+        self.window = ImageMobject(
+            np.zeros((1, 1, 4), dtype=np.uint8),
+            scale_to_resolution=config["pixel_height"],
+            z_index=z_index,
+        )
+        self.add(self.anchor, self.window)
+
+        self._refresh()
+        self.add_updater(lambda m: m._refresh())
+
+    def _pixel_aligned_extent(self, mobject):
+        if isinstance(mobject, VirtualScrollList):
+            # Only the rows in view exist; the width is trimmed after drawing
+            top = mobject.row_center(0)[1] + mobject.row_height / 2
+            bottom = top - mobject.total_height
+            left = mobject.anchor.get_x() - config["frame_width"] / 2
+            right = mobject.anchor.get_x() + config["frame_width"] / 2
+        else:
+            top, bottom = mobject.get_top()[1], mobject.get_bottom()[1]
+            left, right = mobject.get_left()[0], mobject.get_right()[0]
+
+        # Snap outwards onto the frame's pixel grid
+        frame_top = config["frame_height"] / 2
+        frame_left = -config["frame_width"] / 2
+        top = frame_top - math.floor((frame_top - top) / self.unit) * self.unit
+        bottom = frame_top - math.ceil((frame_top - bottom) / self.unit) * self.unit
+        left = frame_left + math.floor((left - frame_left) / self.unit) * self.unit
+        right = frame_left + math.ceil((right - frame_left) / self.unit) * self.unit
+        return top, bottom, left, right
+
+    def _rasterize(self, mobject, top, bottom, left, right):
+        height = round((top - bottom) / self.unit)
+        width = round((right - left) / self.unit)
+
+        strips = []
+        for y in range(0, height, MAX_TILE_PIXELS):
+            rows = min(MAX_TILE_PIXELS, height - y)
+            strip_top = top - y * self.unit
+            strip_bottom = strip_top - rows * self.unit
+            if isinstance(mobject, VirtualScrollList):
+                mobject.set_viewport(strip_top, strip_bottom)
+
+            camera = Camera(
+                frame_center=[(left + right) / 2, (strip_top + strip_bottom) / 2, 0],
+                frame_height=rows * self.unit,
+                frame_width=width * self.unit,
+                pixel_height=rows,
+                pixel_width=width,
+                background_opacity=0,
+            )
+            camera.capture_mobject(mobject)
+
+            # Keep only the columns something was drawn in
+            drawn = np.flatnonzero(camera.pixel_array[:, :, 3].any(axis=0))
+            if len(drawn):
+                start, stop = drawn[0], drawn[-1] + 1
+                strips.append((camera.pixel_array[:, start:stop].copy(), start, rows))
+            else:
+                strips.append((None, 0, rows))
+
+        columns = [(start, start + s.shape[1]) for s, start, _ in strips if s is not None]
+        if not columns:
+            return np.zeros((max(height, 1), 1, 4), dtype=np.uint8), left
+        start = min(c[0] for c in columns)
+        stop = max(c[1] for c in columns)
+
+        texture = np.zeros((height, stop - start, 4), dtype=np.uint8)
+        y = 0
+        for strip, strip_start, rows in strips:
+            if strip is not None:
+                offset = strip_start - start
+                texture[y : y + rows, offset : offset + strip.shape[1]] = strip
+            y += rows
+        return texture, left + start * self.unit
+
+    def _refresh(self):
+        # Whole pixels only, so the slice lands exactly on the frame's grid
+        top = self.anchor.get_y() + round(self.offset.get_value() / self.unit) * self.unit
+        first = max(math.floor((top - self.viewport_top) / self.unit), 0)
+        last = min(math.ceil((top - self.viewport_bottom) / self.unit), len(self.texture))
+
+        if last > first:
+            self.window.pixel_array = self.texture[first:last]
+        else:
+            self.window.pixel_array = np.zeros((1, 1, 4), dtype=np.uint8)
+        self.window.reset_points()
+        self.window.move_to(
+            [self.anchor.get_x(), top - first * self.unit, 0], aligned_edge=UL
+        )
+        return self
+
+    def scroll_to(self, offset):
+        return self.offset.animate.set_value(offset)
+
+    def scroll_to_end(self, bottom=None):
+        # Scroll until the bottom of the content reaches y = bottom (by
+        # default the bottom of the viewport)
+        bottom = self.viewport_bottom if bottom is None else bottom
+        return self.scroll_to(self.total_height - (self.anchor.get_y() - bottom))
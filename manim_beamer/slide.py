@@ -1,10 +1,74 @@
+from contextlib import ExitStack
+from pathlib import Path
+
 from manim import *
 from manim_slides import Slide
 
 from .constants import *
+from .draft import DRAFT_CONFIG, DRAFT_FOLDER, draft_build, draft_mode, placeholders
+from .profiling import SceneProfiler, profile_directory
 
 
 class TalkSlide(Slide):
+    # Set (or export MANIM_BEAMER_PROFILE) to a directory to write a timing
+    # breakdown of each render there
+    profile_dir = None
+    profiler = None
+
+    # None follows MANIM_BEAMER_DRAFT (unset, 1 or placeholders); a slide
+    # being laid out can set True or "placeholders", and False pins it to
+    # full quality in draft builds
+    draft = None
+
+    def __init__(self, *args, **kwargs):
+        # The camera and file writer take their resolution and frame rate
+        # from config when the scene is created, so the draft config has to
+        # be in place before then; render() restores it
+        self.draft_mode = draft_mode(self)
+        self._draft_context = ExitStack()
+        if self.draft_mode:
+            self._draft_context.enter_context(tempconfig(DRAFT_CONFIG))
+        if draft_build():
+            kwargs.setdefault("output_folder", Path(DRAFT_FOLDER))
+        super().__init__(*args, **kwargs)
+
+    def render(self, *args, **kwargs):
+        with self._draft_context:
+            if self.draft_mode == "placeholders":
+                self._draft_context.enter_context(placeholders())
+
+            directory = profile_directory(self)
+            if not directory:
+                return super().render(*args, **kwargs)
+
+            with SceneProfiler(self) as self.profiler:
+                result = super().render(*args, **kwargs)
+            self.profiler.write(directory)
+            return result
+
+    def play(self, *args, **kwargs):
+        if self.profiler is None:
+            return super().play(*args, **kwargs)
+        with self.profiler.animation("play", args):
+            return super().play(*args, **kwargs)
+
+    def wait(self, duration=DEFAULT_WAIT_TIME, *args, **kwargs):
+        if self.draft_mode:
+            # Keep the slide structure, drop the hold
+            duration = min(duration, 1 / config.frame_rate)
+        if self.profiler is None:
+            return super().wait(duration, *args, **kwargs)
+        with self.profiler.animation("wait"):
+            return super().wait(duration, *args, **kwargs)
+
+    def next_slide(self, *args, **kwargs):
+        if self.profiler is None:
+            return super().next_slide(*args, **kwargs)
+        with self.profiler.animation("next_slide"):
+            result = super().next_slide(*args, **kwargs)
+        self.profiler.next_slide()
+        return result
+
     def reveal_in_sequence(self, group, **kwargs):
         for g in group:
             if isinstance(g, Mobject):
@@ -2,6 +2,7 @@ from manim import *
 from manim_slides import Slide
 from manim_beamer import *
 from .constants import *
+from .tex_batch import batch_mathtex
 
 
 class SmartTable(Table):
@@ -9,15 +10,16 @@ class SmartTable(Table):
         self.num_rows = len(entries) + (1 if col_labels else 0)
         self.num_cols = len(entries[0])
         self.col_labels = (
-            None
-            if col_labels is None
-            else [MathTex(c, color=WHITE) for c in col_labels]
+            None if col_labels is None else batch_mathtex(col_labels, color=WHITE)
         )
+
+        # Typeset every cell in one go and hand Table the finished MathTex,
+        # rather than letting it build each cell a second time
+        cells = iter(batch_mathtex([e for row in entries for e in row], color=BLACK))
         super().__init__(
-            entries,
+            [[next(cells) for _ in row] for row in entries],
             col_labels=self.col_labels,
-            element_to_mobject=MathTex,
-            element_to_mobject_config={"color": BLACK},
+            element_to_mobject=lambda cell: cell,
             line_config={"stroke_color": BLACK},
             include_outer_lines=True,
         )
@@ -1,16 +1,68 @@
+from collections import namedtuple
+from itertools import accumulate
+
 from manim import *
 from manim_slides import Slide
 
 from .constants import *
+from .text_cache import cached_text
 
 
 FRAME_WIDTH = config["frame_width"]
 FRAME_HEIGHT = config["frame_height"]
 
 
+# Where a slide sits in the deck. Frames are numbered from 1.
+HeaderFooterState = namedtuple(
+    "HeaderFooterState", ["section", "section_number", "dot", "frame", "total"]
+)
+
+
+class SlideIndex:
+    # Prefix sums of the dots per section and a section -> number map, so any
+    # (section, dot) resolves to its state in constant time
+    def __init__(self, dots_per_sec):
+        self.sections = tuple(dots_per_sec)
+        self.dots_per_sec = dict(dots_per_sec)
+        self.section_numbers = {s: i for i, s in enumerate(self.sections)}
+        self.offsets = list(
+            accumulate((self.dots_per_sec[s] for s in self.sections), initial=0)
+        )
+        self.total = self.offsets[-1]
+
+    def state(self, section, dot):
+        if isinstance(section, int):
+            section_number = section % len(self.sections)
+            section = self.sections[section]
+        else:
+            section_number = self.section_numbers[section]
+        if not 0 <= dot < self.dots_per_sec[section]:
+            raise IndexError(f"{section!r} has no slide {dot}")
+        return HeaderFooterState(
+            section, section_number, dot, self.offsets[section_number] + dot + 1, self.total
+        )
+
+    def next(self, state):
+        if state.dot == self.dots_per_sec[state.section] - 1:
+            return self.state(state.section_number + 1, 0)
+        return self.state(state.section_number, state.dot + 1)
+
+
 class HeaderFooter(Group):
     def _get_slide_count(self):
-        return sum([self.dots_per_sec[s] for s in self.dots_per_sec])
+        return self.index.total
+
+    @property
+    def current_section(self):
+        return self.state.section
+
+    @property
+    def current_section_number(self):
+        return self.state.section_number
+
+    @property
+    def current_dot(self):
+        return self.state.dot
 
     def _create_header(self, dots_per_sec):
         self.h_background = Rectangle(
@@ -29,17 +81,18 @@ class HeaderFooter(Group):
             fill_opacity=1,
         ).to_edge(UP, 0)
 
-        self.sections = list(dots_per_sec)
-        self.dots_per_sec = dots_per_sec
-        self.current_section = self.sections[0]
-        self.current_dot = 0
-        self.current_section_number = 0
+        self.index = SlideIndex(dots_per_sec)
+        self.sections = list(self.index.sections)
+        self.dots_per_sec = self.index.dots_per_sec
+        self.state = self.index.state(0, 0)
 
         self.title_texts = dict(
             zip(
                 self.sections,
                 [
-                    Text(sec, color=WHITE, font_size=36, font=CMU_SANS, weight="BOLD")
+                    cached_text(
+                        sec, color=WHITE, font_size=36, font=CMU_SANS, weight="BOLD"
+                    )
                     .scale(0.35)
                     .set_opacity(0.5)
                     for sec in self.sections
@@ -114,7 +167,7 @@ class HeaderFooter(Group):
         ).to_edge(DOWN, 0)
 
         self.title_text = (
-            Text(title, color=WHITE, font=CMU_SANS, font_size=38, weight=BOLD)
+            cached_text(title, color=WHITE, font=CMU_SANS, font_size=38, weight=BOLD)
             .scale(0.4)
             .move_to(self.f_background)
             .to_edge(LEFT)
@@ -126,22 +179,13 @@ class HeaderFooter(Group):
         )
 
         self.name_text = (
-            Text(name, color=WHITE, font=CMU_SANS, font_size=38, weight=BOLD)
+            cached_text(name, color=WHITE, font=CMU_SANS, font_size=38, weight=BOLD)
             .scale(0.4)
             .move_to(to_midpoint)
             .to_edge(LEFT)
         )
-        total_frames = self._get_slide_count()
-
         self.count_text = (
-            Text(
-                "1/" + str(total_frames),
-                color=WHITE,
-                font=CMU_SANS,
-                font_size=38,
-                weight=BOLD,
-            )
-            .scale(0.4)
+            self._count_text(self.state, weight=BOLD)
             .move_to(self.f_background)
             .to_edge(RIGHT)
         )
@@ -160,57 +204,49 @@ class HeaderFooter(Group):
         self._create_header(dots_per_sec)
         self._create_footer(dots_per_sec, title, name)
 
-    def set_current(self, section, dot_number):
-        animations = []
-        if isinstance(section, int):
-            section = self.sections[section]
+    def _count_text(self, state, weight=NORMAL):
+        return cached_text(
+            f"{state.frame}/{state.total}",
+            color=WHITE,
+            font=CMU_SANS,
+            font_size=38,
+            weight=weight,
+        ).scale(0.4)
+
+    def _apply(self, state):
+        # Only the previous and new section differ from the resting look, so
+        # undoing one and highlighting the other gives the same result
+        # whatever state the header was in before
+        previous = self.state
+        self.title_texts[previous.section].set_opacity(0.5)
+        self.dots[previous.section].set_stroke(opacity=0.5)
+        self.dots[previous.section][previous.dot].set_fill(opacity=0.01)
+
+        self.state = state
+        self.title_texts[state.section].set_opacity(1)
+        self.dots[state.section][state.dot].set_fill(WHITE, opacity=1)
+        self.count_text.become(self._count_text(state).move_to(self.count_text))
+        return self
 
-        self.title_texts[self.current_section].set_opacity(0.5)
-        [d.set_stroke(opacity=0.5) for d in self.dots[self.current_section]]
-        self.dots[self.current_section][self.current_dot].set_fill(opacity=0.01)
-
-        self.current_section = section
-        self.current_section_number = self.sections.index(section)
-        self.current_dot = dot_number
-        self.title_texts[self.current_section].set_opacity(1)
-
-        current_frame = (
-            sum(
-                [
-                    self.dots_per_sec[self.sections[i]]
-                    for i in range(len(self.sections))
-                    if i < self.current_section_number
-                ]
-            )
-            + self.current_dot
-            + 1
-        )
-        total_frames = self._get_slide_count()
-
-        self.count_text.become(
-            Text(
-                str(current_frame) + "/" + str(total_frames),
-                color=WHITE,
-                font=CMU_SANS,
-                font_size=38,
-            )
-            .scale(0.4)
-            .move_to(self.count_text)
-        )
-        [d.animate.set_stroke(opacity=1) for d in self.dots[self.current_section]]
-        self.dots[self.current_section][self.current_dot].set_fill(WHITE, opacity=1)
+    def set_current(self, section, dot_number):
+        return self._apply(self.index.state(section, dot_number))
 
     def next(self):
-        if self.current_dot == self.dots_per_sec[self.current_section] - 1:
-            return self.set_current(self.current_section_number + 1, 0)
-        else:
-            return self.set_current(self.current_section_number, self.current_dot + 1)
+        return self._apply(self.index.next(self.state))
+
+    def at(self, section, dot_number):
+        # A copy showing the given slide, leaving this one untouched, so a
+        # scene's header doesn't depend on which scenes rendered before it
+        return self.copy().set_current(section, dot_number)
 
 
-class SlideTitle(Text):
+class SlideTitle(VGroup):
     def __init__(self, text, **kwargs):
-        super().__init__(
-            text, color=BLACK, font=CMU_SANS, font_size=40, weight=BOLD, **kwargs
+        super().__init__()
+        self.add(
+            cached_text(
+                text, color=BLACK, font=CMU_SANS, font_size=40, weight=BOLD, **kwargs
+            )
         )
         self.scale(0.8)
         self.to_edge(LEFT)
@@ -236,8 +272,13 @@ class TitleSlide(Group):
         ra_logo.width = FRAME_WIDTH / 3.8
         ra_logo.next_to(keyline, DOWN)
 
-        title_text = Paragraph(
-            title, **white_text_style, font_size=48, weight="BOLD", line_spacing=0.55
+        title_text = cached_text(
+            title,
+            Paragraph,
+            **white_text_style,
+            font_size=48,
+            weight="BOLD",
+            line_spacing=0.55,
         ).to_corner(UP + LEFT)
 
         max_width = (ra_logo.get_left() - title_text.get_left())[0] - 0.7
@@ -246,7 +287,7 @@ class TitleSlide(Group):
                 title_text, DOWN, buff=0.3, aligned_edge=LEFT
             ).to_corner(UP + LEFT)
         author_text = (
-            Text(author, **white_text_style, font_size=40)
+            cached_text(author, **white_text_style, font_size=40)
             .scale(0.8)
             .next_to(title_text, DOWN, buff=0.3, aligned_edge=LEFT)
         )
@@ -257,7 +298,7 @@ class TitleSlide(Group):
             )
 
         venue_text = (
-            Text(venue, **white_text_style, font_size=40)
+            cached_text(venue, **white_text_style, font_size=40)
             .scale(0.5)
             .next_to(ra_logo, RIGHT, aligned_edge=DOWN)
             .next_to(author_text, DOWN, aligned_edge=LEFT)
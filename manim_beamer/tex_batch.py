@@ -0,0 +1,237 @@
+import hashlib
+import re
+import subprocess
+from contextlib import contextmanager
+from functools import partial
+
+from manim import *
+from manim.mobject.text import tex_mobject
+from manim.utils.tex_file_writing import tex_hash
+
+from . import tex_cache
+
+STANDALONE_CLASS = re.compile(r"\\documentclass(\[([^\]]*)\])?\{standalone\}")
+
+
+class _DeferredTex(Exception):
+    pass
+
+
+def _template(tex_template):
+    return config["tex_template"] if tex_template is None else tex_template
+
+
+def _texcode(expression, environment, tex_template):
+    if environment is None:
+        return tex_template.get_texcode_for_expression(expression)
+    return tex_template.get_texcode_for_expression_in_env(expression, environment)
+
+
+def _svg_path(expression, environment, tex_template):
+    # Where manim's own tex_to_svg_file looks for an existing SVG
+    output = _texcode(expression, environment, tex_template)
+    return config.get_dir("tex_dir") / (tex_hash(output) + ".svg")
+
+
+def _request_key(expression, environment, tex_template):
+    return (
+        expression,
+        environment,
+        tex_template.body,
+        str(tex_template.tex_compiler),
+        tex_template.output_format,
+    )
+
+
+def is_typeset(expression, environment=None, tex_template=None):
+    tex_template = _template(tex_template)
+    if _svg_path(expression, environment, tex_template).exists():
+        return True
+    cache = tex_cache.active_cache
+    return cache is not None and cache.contains(expression, environment, tex_template)
+
+
+def _multipage_document(requests):
+    # One page per expression: standalone's multi mode turns each
+    # standalone environment into its own cropped page
+    _, environment, tex_template = requests[0]
+    pages = "\n".join(
+        _texcode(expression, environment, tex_template)
+        .split(r"\begin{document}", 1)[1]
+        .rsplit(r"\end{document}", 1)[0]
+        .join([r"\begin{standalone}", r"\end{standalone}"])
+        for expression, _, _ in requests
+    )
+
+    body = tex_template.body
+    match = STANDALONE_CLASS.search(body)
+    options = [o for o in (match.group(2) or "").split(",") if o.strip()]
+    documentclass = r"\documentclass[%s]{standalone}" % ",".join(
+        options + ["multi=true"]
+    )
+    body = body[: match.start()] + documentclass + body[match.end() :]
+    preamble, _ = body.split(r"\begin{document}", 1)
+    return preamble + r"\begin{document}" + "\n" + pages + "\n" + r"\end{document}"
+
+
+def _compile_command(compiler, output_format, tex_file, tex_dir):
+    command = [compiler, "-interaction=batchmode", "-halt-on-error"]
+    if compiler == "xelatex":
+        command += ["-no-pdf"] if output_format == ".xdv" else []
+    else:
+        command += [f"-output-format={output_format[1:]}"]
+    return command + [f"-output-directory={tex_dir.as_posix()}", tex_file.as_posix()]
+
+
+def _compile_batch(requests):
+    # True on success, False if LaTeX failed, None if the output pages could
+    # not be matched up with the expressions
+    _, environment, tex_template = requests[0]
+    document = _multipage_document(requests)
+
+    tex_dir = config.get_dir("tex_dir")
+    tex_dir.mkdir(parents=True, exist_ok=True)
+    stem = "batch-" + hashlib.sha256(document.encode()).hexdigest()[:16]
+    tex_file = tex_dir / f"{stem}.tex"
+    tex_file.write_text(document, encoding="utf-8")
+
+    output_format = tex_template.output_format
+    pages = {}
+    if tex_cache.active_cache is not None:
+        tex_cache.active_cache.latex_runs += 1
+    try:
+        result = subprocess.run(
+            _compile_command(
+                tex_template.tex_compiler, output_format, tex_file, tex_dir
+            ),
+            stdout=subprocess.DEVNULL,
+        )
+        dvi_file = tex_file.with_suffix(output_format)
+        if result.returncode != 0 or not dvi_file.exists():
+            return False
+
+        subprocess.run(
+            [
+                "dvisvgm",
+                *(["--pdf"] if output_format == ".pdf" else []),
+                "--page=1-",
+                "--no-fonts",
+                "--verbosity=0",
+                f"--output={(tex_dir / stem).as_posix()}-%p.svg",
+                dvi_file.as_posix(),
+            ],
+            stdout=subprocess.DEVNULL,
+        )
+
+        # dvisvgm may zero-pad the page numbers, so read them back rather
+        # than predicting the names
+        pages = {
+            int(svg.stem.rsplit("-", 1)[1]): svg
+            for svg in tex_dir.glob(f"{stem}-*.svg")
+        }
+        if sorted(pages) != list(range(1, len(requests) + 1)):
+            return None
+
+        for page, (expression, environment, tex_template) in zip(
+            sorted(pages), requests
+        ):
+            pages[page].replace(_svg_path(expression, environment, tex_template))
+        return True
+    finally:
+        for svg in pages.values():
+            svg.unlink(missing_ok=True)
+        if not config["no_latex_cleanup"]:
+            for f in tex_dir.glob(f"{stem}.*"):
+                f.unlink()
+
+
+# Typesets (expression, environment, tex_template) requests in as few LaTeX
+# runs as possible, returning those that have to be compiled on their own
+def typeset_batch(requests):
+    groups = {}
+    for expression, environment, tex_template in requests:
+        tex_template = _template(tex_template)
+        if is_typeset(expression, environment, tex_template):
+            continue
+        key = _request_key("", environment, tex_template)
+        groups.setdefault(key, []).append((expression, environment, tex_template))
+
+    unbatched = []
+    for group in groups.values():
+        tex_template = group[0][2]
+        if not isinstance(tex_template.tex_compiler, str) or not STANDALONE_CLASS.search(
+            tex_template.body
+        ):
+            unbatched += group
+            continue
+
+        # Empty expressions produce no page, which would shift every page
+        # after them
+        unbatched += [r for r in group if not r[0].strip()]
+        group = [r for r in group if r[0].strip()]
+
+        # Bisect failing batches, so one bad expression only costs a few
+        # extra runs and is then left to manim to report on its own
+        todo = [group] if group else []
+        while todo:
+            batch = todo.pop()
+            if len(batch) == 1:
+                unbatched += batch
+                continue
+            compiled = _compile_batch(batch)
+            if compiled is None:
+                unbatched += batch
+            elif not compiled:
+                todo += [batch[: len(batch) // 2], batch[len(batch) // 2 :]]
+    return unbatched
+
+
+@contextmanager
+def _deferring_tex(requests, individual):
+    typeset = tex_mobject.tex_to_svg_file
+
+    def defer(expression, environment=None, tex_template=None):
+        tex_template = _template(tex_template)
+        key = _request_key(expression, environment, tex_template)
+        if key in individual or is_typeset(expression, environment, tex_template):
+            return typeset(expression, environment, tex_template)
+        requests[key] = (expression, environment, tex_template)
+        raise _DeferredTex()
+
+    tex_mobject.tex_to_svg_file = defer
+    try:
+        yield
+    finally:
+        tex_mobject.tex_to_svg_file = typeset
+
+
+# Calls each builder, typesetting all of their Tex in shared LaTeX runs.
+# Builders run until they reach an expression that hasn't been typeset yet;
+# those expressions are compiled together and the builders run again, until
+# every builder has returned.
+def prepare_tex(builders):
+    results = [None] * len(builders)
+    pending = list(range(len(builders)))
+    individual = set()
+
+    while pending:
+        requests = {}
+        deferred = []
+        for i in pending:
+            try:
+                with _deferring_tex(requests, individual):
+                    results[i] = builders[i]()
+            except _DeferredTex:
+                deferred.append(i)
+
+        typeset_batch(list(requests.values()))
+        for key, request in requests.items():
+            if not is_typeset(*request):
+                individual.add(key)
+        pending = deferred
+
+    return results
+
+
+def batch_mathtex(tex_strings, mobject_class=MathTex, **kwargs):
+    return prepare_tex([partial(mobject_class, s, **kwargs) for s in tex_strings])
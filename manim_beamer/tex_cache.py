@@ -0,0 +1,140 @@
+import fcntl
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from manim import config
+from manim.mobject.text import tex_mobject
+
+from . import tex_batch
+
+DEFAULT_TEX_CACHE = Path.home() / ".cache" / "manim_beamer" / "tex"
+DEFAULT_TEX_CACHE_BYTES = 1024 * 2**20
+
+# Entries used this recently are never evicted, so another worker can't
+# delete an SVG between handing out its path and parsing it
+EVICTION_GRACE_SECONDS = 600
+EVICT_EVERY = 256
+
+active_cache = None
+
+
+class TexCache:
+    def __init__(self, directory=DEFAULT_TEX_CACHE, max_bytes=DEFAULT_TEX_CACHE_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        # LaTeX compiler invocations, batched or not; a miss whose SVG a
+        # batch already produced isn't one
+        self.latex_runs = 0
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._compile = None
+        self._puts = 0
+
+    def key(self, expression, environment=None, tex_template=None):
+        if tex_template is None:
+            tex_template = config["tex_template"]
+        hasher = hashlib.sha256()
+        for part in (
+            expression,
+            environment,
+            tex_template.body,
+            tex_template.tex_compiler,
+            tex_template.output_format,
+        ):
+            hasher.update(str(part).encode())
+            hasher.update(b"\0")
+        return hasher.hexdigest()
+
+    def path(self, key):
+        return self.directory / key[:2] / f"{key}.svg"
+
+    def contains(self, expression, environment=None, tex_template=None):
+        return self.path(self.key(expression, environment, tex_template)).exists()
+
+    def get(self, key):
+        path = self.path(key)
+        try:
+            # The modification time doubles as the last-used time for LRU
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def put(self, key, svg_file):
+        path = self.path(key)
+        path.parent.mkdir(exist_ok=True)
+
+        # Write under a temporary name and rename into place, so concurrent
+        # readers only ever see complete files
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as dst, open(svg_file, "rb") as src:
+            shutil.copyfileobj(src, dst)
+        os.replace(tmp, path)
+
+        self._puts += 1
+        if self._puts % EVICT_EVERY == 0:
+            self.evict()
+        return path
+
+    def evict(self):
+        with open(self.directory / ".lock", "w") as lock:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return  # another worker is already evicting
+
+            entries = []
+            for path in self.directory.glob("*/*.svg"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            cutoff = time.time() - EVICTION_GRACE_SECONDS
+            for mtime, size, path in sorted(entries):
+                if total <= self.max_bytes or mtime > cutoff:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+
+    def tex_to_svg_file(self, expression, environment=None, tex_template=None):
+        key = self.key(expression, environment, tex_template)
+        cached = self.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        template = tex_batch._template(tex_template)
+        if not tex_batch._svg_path(expression, environment, template).exists():
+            self.latex_runs += 1
+        svg_file = self._compile(expression, environment, tex_template)
+        return self.put(key, svg_file)
+
+    def install(self):
+        global active_cache
+
+        # Every Tex/MathTex typesets through this name, so replacing it routes
+        # all of them (including those built inside manim_beamer components)
+        # through the cache
+        self._compile = tex_mobject.tex_to_svg_file
+        tex_mobject.tex_to_svg_file = self.tex_to_svg_file
+        active_cache = self
+        self.evict()
+        return self
+
+
+def install_tex_cache(directory=None, max_bytes=None):
+    directory = directory or os.environ.get("MANIM_BEAMER_TEX_CACHE", DEFAULT_TEX_CACHE)
+    if max_bytes is None:
+        max_bytes = int(
+            os.environ.get("MANIM_BEAMER_TEX_CACHE_MB", DEFAULT_TEX_CACHE_BYTES // 2**20)
+        ) * 2**20
+    return TexCache(directory, max_bytes).install()
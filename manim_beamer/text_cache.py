@@ -0,0 +1,49 @@
+import fcntl
+import os
+from functools import wraps
+from pathlib import Path
+
+from manim import *
+
+DEFAULT_TEXT_CACHE = Path.home() / ".cache" / "manim_beamer" / "text"
+
+_shaped = {}
+
+
+def cached_text(text, mobject_class=Text, **kwargs):
+    # Text/MarkupText/Paragraph re-run font lookup, Pango layout and SVG
+    # parsing for every instance, so shape each distinct string once and
+    # hand out copies
+    key = (mobject_class, text, repr(sorted(kwargs.items())))
+    if key not in _shaped:
+        _shaped[key] = mobject_class(text, **kwargs)
+    return _shaped[key].copy()
+
+
+def _locked(text2svg, lock_path):
+    # Pango writes (and manim then edits) the SVG in place, so a worker
+    # must not read one while another is still producing it
+    @wraps(text2svg)
+    def wrapper(self, *args, **kwargs):
+        with open(lock_path, "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            return text2svg(self, *args, **kwargs)
+
+    return wrapper
+
+
+def install_text_cache(directory=None):
+    # Point Text's own on-disk SVG cache at a directory that outlives a
+    # single render and is shared by every worker
+    directory = Path(
+        directory or os.environ.get("MANIM_BEAMER_TEXT_CACHE", DEFAULT_TEXT_CACHE)
+    )
+    directory.mkdir(parents=True, exist_ok=True)
+    config.text_dir = str(directory)
+
+    for mobject_class in (Text, MarkupText):
+        if not hasattr(mobject_class._text2svg, "__wrapped__"):
+            mobject_class._text2svg = _locked(
+                mobject_class._text2svg, directory / ".lock"
+            )
+    return directory
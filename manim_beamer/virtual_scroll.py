@@ -0,0 +1,126 @@
+import math
+from collections import OrderedDict
+from functools import partial
+
+from manim import *
+
+from .tex_batch import prepare_tex
+
+
+class VirtualScrollList(Group):
+    # A column of entries that only builds the ones near the viewport.
+    #
+    # Rows sit at a fixed pitch below the list's top edge, and the offset
+    # tracker scrolls them up. Each frame, rows that have left the viewport
+    # (plus margin rows either side) are dropped into a bounded cache of
+    # built mobjects, and rows coming into view are taken from it or built,
+    # so memory stays flat however long the list is.
+    #
+    #     big_list = VirtualScrollList(big_constraints_list, color=BLACK)
+    #     self.add(big_list)
+    #     self.play(big_list.scroll_to_end(), run_time=25)
+
+    def __init__(
+        self,
+        entries,
+        mobject_class=MathTex,
+        top=ORIGIN,
+        row_height=None,
+        buff=DEFAULT_MOBJECT_TO_MOBJECT_BUFFER,
+        viewport_top=None,
+        viewport_bottom=None,
+        margin=2,
+        cache_size=64,
+        z_index=0,
+        **kwargs
+    ):
+        super().__init__(z_index=z_index)
+        self.entries = entries
+        self.make_entry = partial(mobject_class, **kwargs)
+        self.margin = margin
+        self.cache_size = cache_size
+        self.viewport_top = (
+            config["frame_height"] / 2 if viewport_top is None else viewport_top
+        )
+        self.viewport_bottom = (
+            -config["frame_height"] / 2 if viewport_bottom is None else viewport_bottom
+        )
+
+        self.active = {}
+        self.recycled = OrderedDict()
+
+        if row_height is None:
+            # Rows have to share one height for the visible range to be
+            # computable, so take the tallest of the first few
+            sample = range(min(len(entries), 16))
+            built = prepare_tex([partial(self.make_entry, entries[i]) for i in sample])
+            row_height = max((m.height for m in built), default=0)
+            self.recycled.update(zip(sample, built))
+        self.row_height = row_height
+        self.pitch = row_height + buff
+        self.total_height = max(len(entries) * self.pitch - buff, 0)
+
+        self.offset = ValueTracker(0)
+        # Moving the list moves this, and rows are placed relative to it
+        self.anchor = VectorizedPoint(top)
+        self.add(self.anchor)
+
+        self._refresh()
+        self.add_updater(lambda m: m._refresh())
+
+    def _list_top(self):
+        return self.anchor.get_center() + UP * self.offset.get_value()
+
+    def row_center(self, i):
+        return self._list_top() + DOWN * (i * self.pitch + self.row_height / 2)
+
+    def visible_range(self):
+        top = self._list_top()[1]
+        first = math.floor((top - self.viewport_top - self.row_height) / self.pitch)
+        last = math.ceil((top - self.viewport_bottom) / self.pitch)
+        return range(
+            max(first - self.margin, 0),
+            min(last + self.margin, len(self.entries)),
+        )
+
+    def set_viewport(self, top, bottom):
+        self.viewport_top = top
+        self.viewport_bottom = bottom
+        return self._refresh()
+
+    def _take(self, indices):
+        taken = {i: self.recycled.pop(i) for i in indices if i in self.recycled}
+        missing = [i for i in indices if i not in taken]
+        built = prepare_tex(
+            [partial(self.make_entry, self.entries[i]) for i in missing]
+        )
+        taken.update(zip(missing, built))
+        return taken
+
+    def _refresh(self):
+        visible = self.visible_range()
+
+        leaving = [i for i in self.active if i not in visible]
+        for i in leaving:
+            self.recycled[i] = self.active.pop(i)
+        while len(self.recycled) > self.cache_size:
+            self.recycled.popitem(last=False)
+
+        entering = self._take([i for i in visible if i not in self.active])
+        for i, mobject in entering.items():
+            mobject.set_z_index(self.z_index)
+            self.active[i] = mobject
+
+        for i in visible:
+            self.active[i].move_to(self.row_center(i))
+        self.submobjects = [self.anchor] + [self.active[i] for i in visible]
+        return self
+
+    def scroll_to(self, offset):
+        return self.offset.animate.set_value(offset)
+
+    def scroll_to_end(self, bottom=None):
+        # Scroll until the last row's bottom edge reaches y = bottom (by
+        # default the bottom of the viewport)
+        bottom = self.viewport_bottom if bottom is None else bottom
+        return self.scroll_to(self.total_height - (self.anchor.get_y() - bottom))
@@ -0,0 +1,188 @@
+# A proof logger for the solver in proof_logging_solver.py that keeps proof
+# writing off the search thread. log_guess, justify_backtrack and
+# log_solution only append (op, a, b) integer records to a chunk; full chunks
+# go through a bounded queue to a background writer (a thread, or a process
+# with process=True) that formats them into VeriPB lines and writes them in
+# large blocks. When max_chunks chunks are waiting, the search blocks until
+# the writer catches up. Whatever is left is flushed on close() or at exit,
+# which also ends the proof. If the writer fails (a bad path, a full disk),
+# the next hand-off to it or close() raises.
+#
+#     with ProofLogger("search.pbp") as proof:
+#         run_solver(state, proof)
+#
+# The writer rebuilds the guess stack from the records, so justifying a
+# backtrack writes "rup" of the negated guesses that led to the node.
+# Variables can be any hashable objects and are numbered in order of first
+# use; values are integers.
+
+import atexit
+import multiprocessing
+import queue
+import threading
+from array import array
+
+GUESS = 1
+BACKTRACK = 2
+ASSIGN = 3
+SOLUTION = 4
+
+HEADER = "pseudo-Boolean proof version 2.0\n"
+# No claim about the instance, just a well-formed end for the checker
+TRAILER = "output NONE ;\nconclusion NONE ;\nend pseudo-Boolean proof ;\n"
+
+
+def _literal(var, value):
+    return f"x{var}_{value}" if value >= 0 else f"x{var}_m{-value}"
+
+
+def _format(records, stack, assignment, lines):
+    for i in range(0, len(records), 3):
+        op, a, b = records[i], records[i + 1], records[i + 2]
+        if op == GUESS:
+            stack.append(_literal(a, b))
+        elif op == BACKTRACK:
+            lines.append("rup " + "".join(f"1 ~{l} " for l in stack) + ">= 1 ;\n")
+            if stack:
+                stack.pop()
+        elif op == ASSIGN:
+            assignment.append(_literal(a, b))
+        elif op == SOLUTION:
+            lines.append("solx " + "".join(l + " " for l in assignment) + ";\n")
+            assignment.clear()
+
+
+def _write_proof(path, chunks, buffer_size):
+    stack, assignment = [], []
+    with open(path, "w", encoding="utf-8", buffering=buffer_size) as f:
+        f.write(HEADER)
+        while True:
+            item = chunks.get()
+            if item is None:
+                f.write(TRAILER)
+                return
+            records, names = item
+            lines = [f"* x{id} is {name}\n" for id, name in names]
+            _format(records, stack, assignment, lines)
+            f.write("".join(lines))
+
+
+class ProofLogger:
+    def __init__(
+        self, path, chunk_records=8192, max_chunks=64, process=False, buffer_size=1 << 20
+    ):
+        self.chunk_size = 3 * chunk_records
+        if process:
+            context = multiprocessing.get_context("spawn")
+            self._chunks = context.Queue(maxsize=max_chunks)
+            self._writer = context.Process(
+                target=_write_proof, args=(path, self._chunks, buffer_size), daemon=True
+            )
+        else:
+            self._chunks = queue.Queue(maxsize=max_chunks)
+            self._writer = threading.Thread(
+                target=self._write_in_thread,
+                args=(path, self._chunks, buffer_size),
+                daemon=True,
+            )
+        self._error = None
+        self._writer.start()
+
+        self._records = array("q")
+        self.ids = {}
+        self._new_names = []
+        self.closed = False
+        atexit.register(self.close)
+
+    def _write_in_thread(self, *args):
+        try:
+            _write_proof(*args)
+        except BaseException as e:
+            self._error = e
+
+    def _raise_if_failed(self):
+        exitcode = getattr(self._writer, "exitcode", 0)
+        if self._error is None and not exitcode:
+            return
+        if exitcode:
+            # Nothing reads the queue any more, so don't wait to flush it at exit
+            self._chunks.cancel_join_thread()
+            raise RuntimeError(f"proof writer exited with code {exitcode}")
+        raise RuntimeError("proof writer failed") from self._error
+
+    def _id(self, var):
+        id = self.ids.get(var)
+        if id is None:
+            id = self.ids[var] = len(self.ids) + 1
+            self._new_names.append((id, str(var)))
+        return id
+
+    def _put(self, item):
+        # Blocks while the queue is full, but not forever if the writer died
+        while True:
+            try:
+                self._chunks.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                if not self._writer.is_alive():
+                    self._raise_if_failed()
+                    raise RuntimeError("proof writer stopped") from None
+
+    def _hand_off(self):
+        if not self._writer.is_alive():
+            self._raise_if_failed()
+            raise RuntimeError("proof writer stopped")
+        self._put((self._records, self._new_names))
+        self._records = array("q")
+        self._new_names = []
+
+    def log_guess(self, var, value):
+        records = self._records
+        records.append(GUESS)
+        records.append(self._id(var))
+        records.append(value)
+        if len(records) >= self.chunk_size:
+            self._hand_off()
+
+    def justify_backtrack(self, state=None):
+        records = self._records
+        records.append(BACKTRACK)
+        records.append(0)
+        records.append(0)
+        if len(records) >= self.chunk_size:
+            self._hand_off()
+
+    def log_solution(self, assigned_vars, state=None):
+        if hasattr(assigned_vars, "items"):
+            assigned_vars = assigned_vars.items()
+        records = self._records
+        for var, value in assigned_vars:
+            records.append(ASSIGN)
+            records.append(self._id(var))
+            records.append(value)
+        records.append(SOLUTION)
+        records.append(0)
+        records.append(0)
+        if len(records) >= self.chunk_size:
+            self._hand_off()
+
+    def flush(self):
+        # Hands the current chunk to the writer; doesn't wait for the disk
+        if self._records:
+            self._hand_off()
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        atexit.unregister(self.close)
+        self.flush()
+        self._put(None)
+        self._writer.join()
+        self._raise_if_failed()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,218 @@
+# A runnable version of the solver on the slides (solver_code.py and
+# proof_logging_solver.py), with the same propagate / choose_branch_var /
+# guess structure. Rather than cloning the state for every value tried, it
+# records each domain change on a trail and undoes back to a mark when the
+# search backtracks, so a node costs what it changes rather than the size of
+# the model. run_cloning_solver is the slides' version, kept for comparison.
+#
+# Domains are sets of non-negative integers stored as bitmasks (bit v set
+# when v is in the domain).
+#
+#     model = queens(8)
+#     stats = run(model)
+#     stats.solutions  # 92
+
+
+class NodeLimit(Exception):
+    pass
+
+
+class Stats:
+    def __init__(self, node_limit=None):
+        self.nodes = 0
+        self.solutions = 0
+        self.node_limit = node_limit
+
+    def node(self):
+        self.nodes += 1
+        if self.node_limit is not None and self.nodes > self.node_limit:
+            raise NodeLimit
+
+
+class State:
+    def __init__(self, domains):
+        self.domains = list(domains)
+        self.trail = []
+        # Every variable before first_free is assigned
+        self.first_free = 0
+
+    def clone(self):
+        state = State.__new__(State)
+        state.domains = self.domains[:]
+        state.trail = []
+        state.first_free = self.first_free
+        return state
+
+    def get_domain(self, var):
+        mask = self.domains[var]
+        while mask:
+            low = mask & -mask
+            yield low.bit_length() - 1
+            mask ^= low
+
+    def is_assigned(self, var):
+        mask = self.domains[var]
+        return mask & (mask - 1) == 0
+
+    def value(self, var):
+        return self.domains[var].bit_length() - 1
+
+    @property
+    def assigned_vars(self):
+        return {var: self.value(var) for var in range(len(self.domains))}
+
+    def set_domain(self, var, mask):
+        old = self.domains[var]
+        if mask != old:
+            self.trail.append((var, old))
+            self.domains[var] = mask
+
+    def remove(self, var, value):
+        if value >= 0:
+            self.set_domain(var, self.domains[var] & ~(1 << value))
+        return self.domains[var] != 0
+
+    def guess(self, var, value):
+        self.set_domain(var, 1 << value)
+
+    def mark(self):
+        return len(self.trail)
+
+    def undo(self, mark):
+        trail, domains = self.trail, self.domains
+        while len(trail) > mark:
+            var, old = trail.pop()
+            domains[var] = old
+            if var < self.first_free:
+                self.first_free = var
+
+
+class NotEqual:
+    # x != y + offset
+    def __init__(self, x, y, offset=0):
+        self.x, self.y, self.offset = x, y, offset
+        self.vars = (x, y)
+
+    def propagate(self, state):
+        if state.is_assigned(self.y):
+            if not state.remove(self.x, state.value(self.y) + self.offset):
+                return False
+        if state.is_assigned(self.x):
+            if not state.remove(self.y, state.value(self.x) - self.offset):
+                return False
+        return True
+
+
+class Model:
+    def __init__(self, domains, constraints):
+        self.domains = domains
+        self.constraints = constraints
+        self.watches = [[] for _ in domains]
+        for c in constraints:
+            for var in c.vars:
+                self.watches[var].append(c)
+
+
+def queens(n, copies=1):
+    # copies independent n-queens problems side by side, so the model grows
+    # while each decision only touches its own board
+    domains, constraints = [], []
+    for board in range(copies):
+        base = board * n
+        domains += [(1 << n) - 1] * n
+        for i in range(n):
+            for j in range(i + 1, n):
+                x, y = base + i, base + j
+                constraints += [
+                    NotEqual(x, y),
+                    NotEqual(x, y, j - i),
+                    NotEqual(x, y, i - j),
+                ]
+    return Model(domains, constraints)
+
+
+def propagate(state, model, changed):
+    # Runs the constraints watching changed variables until nothing changes
+    queue = list(changed)
+    while queue:
+        var = queue.pop()
+        for c in model.watches[var]:
+            mark = state.mark()
+            if not c.propagate(state):
+                return False
+            queue += [v for v, _ in state.trail[mark:]]
+    return True
+
+
+def choose_branch_var(state):
+    while state.first_free < len(state.domains):
+        if not state.is_assigned(state.first_free):
+            return state.first_free
+        state.first_free += 1
+    return None
+
+
+def run_solver(state, model, stats, changed=(), proof=None):
+    stats.node()
+    if propagate(state, model, changed):
+        branch_var = choose_branch_var(state)
+        if branch_var is None:
+            stats.solutions += 1
+            if proof:
+                proof.log_solution(state.assigned_vars, state)
+                proof.justify_backtrack(state)
+            return True
+        else:
+            for value in list(state.get_domain(branch_var)):
+                mark = state.mark()
+                # guess branch_var == value
+                if proof:
+                    proof.log_guess(branch_var, value)
+                state.guess(branch_var, value)
+                run_solver(state, model, stats, (branch_var,), proof)
+                state.undo(mark)
+            if proof:
+                proof.justify_backtrack(state)
+            return False
+
+    if proof:
+        proof.justify_backtrack(state)
+    return False
+
+
+def run_cloning_solver(state, model, stats, changed=(), proof=None):
+    stats.node()
+    if propagate(state, model, changed):
+        branch_var = choose_branch_var(state)
+        if branch_var is None:
+            stats.solutions += 1
+            if proof:
+                proof.log_solution(state.assigned_vars, state)
+                proof.justify_backtrack(state)
+            return True
+        else:
+            for value in list(state.get_domain(branch_var)):
+                new_state = state.clone()
+                # guess branch_var == value
+                if proof:
+                    proof.log_guess(branch_var, value)
+                new_state.guess(branch_var, value)
+                run_cloning_solver(new_state, model, stats, (branch_var,), proof)
+            if proof:
+                proof.justify_backtrack(state)
+            return False
+
+    if proof:
+        proof.justify_backtrack(state)
+    return False
+
+
+def run(model, solver=run_solver, node_limit=None, proof=None):
+    # Searches the whole tree (or up to node_limit nodes) and returns Stats
+    stats = Stats(node_limit)
+    state = State(model.domains)
+    try:
+        solver(state, model, stats, range(len(model.domains)), proof)
+    except NodeLimit:
+        stats.nodes -= 1
+    return stats
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The talk's helper modules live at the top of the repo, next to aaai.py
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,63 @@
+from bounds_propagation import propagate_multiplication
+
+
+def test_x_pruned_when_only_z_holds_zero():
+    x, y, z, consistent = propagate_multiplication([[-10, 10]], [[1, 2]], [[-3, 4]])
+    assert consistent.all()
+    assert x.tolist() == [[-3, 4]]
+
+
+def test_y_pruned_when_only_z_holds_zero():
+    x, y, z, consistent = propagate_multiplication([[1, 2]], [[-10, 10]], [[-3, 4]])
+    assert consistent.all()
+    assert y.tolist() == [[-3, 4]]
+
+
+def test_x_left_alone_when_y_and_z_hold_zero():
+    x, y, z, consistent = propagate_multiplication([[-10, 10]], [[-1, 2]], [[-3, 4]])
+    assert x.tolist() == [[-10, 10]]
+
+
+def test_y_zero_without_zero_product_fails():
+    x, y, z, consistent = propagate_multiplication([[-10, 10]], [[0, 0]], [[1, 4]])
+    assert not consistent.any()
+
+
+def test_header_example():
+    x, y, z, consistent = propagate_multiplication([[-6, 5]], [[-1, 2]], [[-4, -1]])
+    assert x.tolist() == [[-4, 4]]
+
+
+def test_split_y_part_without_support_is_dropped():
+    # y < 0 would need x >= 2; only y > 0 is left, so x <= -1
+    x, y, z, consistent = propagate_multiplication([[-3, 1]], [[-2, 3]], [[-3, -3]])
+    assert x.tolist() == [[-3, -1]]
+    assert y.tolist() == [[1, 3]]
+
+
+def _supported(x, y, z):
+    # Bounds of the values taking part in some solution, or None
+    solutions = [
+        (a, b, a * b)
+        for a in range(x[0], x[1] + 1)
+        for b in range(y[0], y[1] + 1)
+        if z[0] <= a * b <= z[1]
+    ]
+    if not solutions:
+        return None
+    return [[min(s[i] for s in solutions), max(s[i] for s in solutions)] for i in range(3)]
+
+
+def test_never_removes_a_solution():
+    # Interval reasoning doesn't see divisibility, so bounds may stay wider
+    # than the solutions, but never narrower
+    ranges = [[lo, hi] for lo in range(-3, 4) for hi in range(lo, 4)]
+    cases = [(x, y, z) for x in ranges for y in ranges[::3] for z in ranges[::2]]
+    x, y, z, consistent = propagate_multiplication(*zip(*cases))
+    for i, case in enumerate(cases):
+        expected = _supported(*case)
+        if expected is None:
+            continue
+        assert consistent[i], case
+        for got, want in zip((x[i], y[i], z[i]), expected):
+            assert got[0] <= want[0] and got[1] >= want[1], case
@@ -0,0 +1,51 @@
+import importlib.util
+import sys
+
+import pytest
+
+pytest.importorskip("manim")
+pytest.importorskip("manim_slides")
+
+from manim_beamer.fingerprint import SceneFingerprinter
+
+TALK = '''
+import os
+
+
+class Bugs:
+    def construct(self):
+        for file in sorted(os.listdir("./img/bugs")):
+            print(file)
+'''
+
+
+@pytest.fixture
+def talk(tmp_path, monkeypatch):
+    (tmp_path / "img" / "bugs").mkdir(parents=True)
+    (tmp_path / "img" / "bugs" / "a.png").write_bytes(b"a")
+    (tmp_path / "talk.py").write_text(TALK)
+    spec = importlib.util.spec_from_file_location("talk", tmp_path / "talk.py")
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, "talk", module)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _fingerprint(talk):
+    return SceneFingerprinter(talk, {}).fingerprint(talk.Bugs)
+
+
+def test_listed_directory_files_count(talk, tmp_path):
+    bugs = tmp_path / "img" / "bugs"
+    before = _fingerprint(talk)
+
+    (bugs / "a.png").write_bytes(b"changed")
+    changed = _fingerprint(talk)
+    assert changed != before
+
+    (bugs / "b.png").write_bytes(b"b")
+    added = _fingerprint(talk)
+    assert added != changed
+
+    (bugs / "b.png").unlink()
+    assert _fingerprint(talk) == changed